@@ -1,7 +1,3 @@
-from pygments import highlight
-from pygments.formatters import HtmlFormatter
-from pygments.lexers import PythonLexer, get_lexer_by_name
-
 from mixt import Element, Required, h
 from mixt.contrib.css import css_vars, CssDict
 from mixt.exceptions import InvalidChildrenError
@@ -15,6 +11,8 @@ class SourceCode(Element):
     @css_vars(globals())
     @classmethod
     def render_css_global(cls, context):
+        from pygments.formatters import HtmlFormatter
+
         return CssDict({
             comment(): f"<{cls.__module__}.{cls.__name__}>",
             raw(): HtmlFormatter().get_style_defs(".code"),
@@ -43,6 +41,10 @@ class SourceCode(Element):
         super().prepend(child_or_children)
 
     def render(self, context):
+        from pygments import highlight
+        from pygments.formatters import HtmlFormatter
+        from pygments.lexers import get_lexer_by_name
+
         lexer = get_lexer_by_name(self.language, stripall=True)
         return h.Raw(
             highlight(str(self.children()[0]), lexer, HtmlFormatter(cssclass="code"))
@@ -1,7 +1,6 @@
 # coding: mixt
 
 from docutils import nodes
-from docutils.examples import internals
 
 from slugify import slugify
 
@@ -113,6 +112,7 @@ def htmlize_node(node, id_prefix='', h_level=2):
 
 
 def htmlize_rst(text, id_prefix='', h_level=2):
+    from docutils.examples import internals  # loads the whole docutils publisher
     return htmlize_node(internals(text)[0], id_prefix, h_level) if text else None
 
 
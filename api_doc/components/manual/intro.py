@@ -1,5 +1,4 @@
 from docutils import nodes
-from docutils.examples import internals
 import os.path
 
 from mixt import h
@@ -20,6 +19,8 @@ class Intro(_Manual):
         )
 
     def render(self, context):
+        from docutils.examples import internals  # loads the whole docutils publisher
+
         readme_path = self.get_path('README.rst')
 
         with open(readme_path) as file:
@@ -1,5 +1,4 @@
 from docutils import nodes
-from docutils.examples import internals
 import os.path
 
 from mixt import h
@@ -11,6 +10,8 @@ from .base import _Manual
 class UserGuide(_Manual):
 
     def render(self, context):
+        from docutils.examples import internals  # loads the whole docutils publisher
+
         readme_path = os.path.normpath(
             os.path.join(
                 os.path.dirname(__file__),
@@ -70,53 +70,66 @@ class _BaseContainer(Element):
             comment(): f"</{cls.__module__}.BaseContainer.{cls.__name__}>",
         })
 
-    def render_content(self, id_prefix, context):
+    def render_doc_parts(self, id_prefix, context):
         obj = self.obj
+        kind = self.__kind__
+        part_level = self.h_level + 1
+        item_level = self.h_level + 2
 
         doc_example = doc_attributes = doc_functions = None
 
         if obj.example:
-            doc_example = <DocPart kind={self.__kind__} subkind="example" id_prefix={id_prefix} level={self.h_level+1} open>
+            doc_example = <DocPart kind={kind} subkind="example" id_prefix={id_prefix} level={part_level} open>
                 <DocHeader menu="Example">Example</DocHeader>
                 <Code code={obj.example} />
             </DocPart>
 
         if obj.attrs:
-            doc_attributes = <DocPart kind={self.__kind__} subkind="attributes" id_prefix={id_prefix} level={self.h_level+1} open>
+            attrs_id_prefix = f"{id_prefix}-attributes-"
+            doc_attributes = <DocPart kind={kind} subkind="attributes" id_prefix={id_prefix} level={part_level} open>
                 <DocHeader menu="Attributes">Attributes</DocHeader>
                 {[
-                    <NamedValue value={attr} h_level={self.h_level+2} id_prefix="{id_prefix}-attributes-"/>
+                    <NamedValue value={attr} h_level={item_level} id_prefix={attrs_id_prefix}/>
                     for attr in obj.attrs
                 ]}
             </DocPart>
 
         if obj.functions:
-            doc_functions = <DocPart kind={self.__kind__} subkind={self.__functions_kind__} id_prefix={id_prefix} level={self.h_level+1} open>
-                <DocHeader menu={self.__functions_kind_title__}>{self.__functions_kind_title__}</DocHeader>
+            functions_kind = self.__functions_kind__
+            functions_kind_title = self.__functions_kind_title__
+            functions_id_prefix = f"{id_prefix}-{functions_kind}-"
+            doc_functions = <DocPart kind={kind} subkind={functions_kind} id_prefix={id_prefix} level={part_level} open>
+                <DocHeader menu={functions_kind_title}>{functions_kind_title}</DocHeader>
                 {[
-                    <Function obj={function} h_level={self.h_level+2} id_prefix="{id_prefix}-{self.__functions_kind__}-"/>
+                    <Function obj={function} h_level={item_level} id_prefix={functions_id_prefix}/>
                     for function in obj.functions
                 ]}
             </DocPart>
 
+        return doc_example, doc_attributes, doc_functions
+
+    def render_content(self, id_prefix, context):
+        doc_parts = tuple(
+            part
+            for part in self.render_doc_parts(id_prefix, context)
+            if part is not None
+        )
+
         children = self.children()
+        if not children:
+            return doc_parts
 
-        return [
-            children if self.children_position == 'start' else None,
-            [
-                doc_example,
-                doc_attributes,
-                doc_functions,
-            ],
-            children if self.children_position == 'end' else None,
-        ]
+        if self.children_position == 'start':
+            return (*children, *doc_parts)
+        return (*doc_parts, *children)
 
     def render(self, context):
         obj = self.obj
-        id_prefix = f'{self.id_prefix}{self.__kind__}-{self.obj.name}'
+        kind = self.__kind__
+        id_prefix = f'{self.id_prefix}{kind}-{obj.name}'
 
 
-        return <DocPart kind={self.__kind__} id_prefix={id_prefix} level={self.h_level} open={self.open}>
+        return <DocPart kind={kind} id_prefix={id_prefix} level={self.h_level} open={self.open}>
             <DocHeader menu={obj.name}>{obj.name}</DocHeader>
 
             <DocString doc={obj.doc} open={self.open_doc_details} />
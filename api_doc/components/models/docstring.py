@@ -1,6 +1,5 @@
 # coding: mixt
 
-from docutils.examples import internals
 from typing import List
 
 from mixt import Element, Required, html
@@ -54,10 +53,10 @@ class DocString(Element):
         summary = None
         details = None
 
-        if not self.hide_summary:
+        if not self.hide_summary and doc.summary:
             summary = htmlize_summary(doc.summary)
 
-        if not self.hide_details:
+        if not self.hide_details and doc.details:
             details = htmlize_details(doc.details)
 
         if summary and details:
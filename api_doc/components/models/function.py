@@ -66,6 +66,9 @@ class Function(Element):
         func = self.obj
         kind = func.kind or 'function'
         id_prefix = f'{self.id_prefix}{func.name}'
+        h_level = self.h_level
+        part_level = h_level + 1
+        item_level = h_level + 2
 
         docstring_details = doc_arguments = doc_return = doc_raises = doc_example = None
 
@@ -75,26 +78,27 @@ class Function(Element):
         args = None
         len_args = len(func.args)
         if len_args:
-            args = [
-               [
-                   html.Span(_class="function-arg")(
-                       arg.name,
-                       ': ',
-                       html.Code()(arg.type),
-                       [
-                           ' = ',
-                           html.Code()(getattr(arg.default, '__name__', str(arg.default)))
-                       ] if arg.has_default else '',
-                       ', ' if index < len_args - 1 else ''
-                   )
-               ]
-               for index, arg in enumerate(func.args)
-            ],
-
-            doc_arguments = <DocPart kind="function" subkind="arguments" id_prefix={id_prefix} level={self.h_level+1} open>
+            args = []
+            for index, arg in enumerate(func.args, 1):
+                default = ''
+                if arg.has_default:
+                    default = [
+                        ' = ',
+                        html.Code()(getattr(arg.default, '__name__', None) or str(arg.default))
+                    ]
+                args.append(html.Span(_class="function-arg")(
+                    arg.name,
+                    ': ',
+                    html.Code()(arg.type),
+                    default,
+                    ', ' if index < len_args else ''
+                ))
+
+            arguments_id_prefix = f"{id_prefix}-arguments-"
+            doc_arguments = <DocPart kind="function" subkind="arguments" id_prefix={id_prefix} level={part_level} open>
                 <DocHeader menu="Arguments">Arguments</DocHeader>
                 {[
-                    <NamedValue value={arg} h_level={self.h_level+2} id_prefix="{id_prefix}-arguments-" />
+                    <NamedValue value={arg} h_level={item_level} id_prefix={arguments_id_prefix} />
                     for arg
                     in func.args
                 ]}
@@ -112,7 +116,8 @@ class Function(Element):
                 return_type = func.ret[0].type
             return_type = [' → ', html.Code()(return_type)]
 
-            doc_return = <DocPart kind="function" subkind="returns" id_prefix={id_prefix} level={self.h_level+1} open>
+            returns_id_prefix = f"{id_prefix}-returns-"
+            doc_return = <DocPart kind="function" subkind="returns" id_prefix={id_prefix} level={part_level} open>
                 <DocHeader menu="Returns">Returns</DocHeader>
                 <if cond={len_ret > 1}>
                     <p>Multiple return values ({len_ret}):</p>
@@ -120,9 +125,9 @@ class Function(Element):
                 {[
                     <UnnamedValue
                         value={ret}
-                        h_level={self.h_level+2}
+                        h_level={item_level}
                         index={index if len_ret > 1 else NotProvided}
-                         id_prefix="{id_prefix}-returns-"
+                        id_prefix={returns_id_prefix}
                     />
                     for index, ret
                     in enumerate(func.ret, 1)
@@ -130,22 +135,23 @@ class Function(Element):
             </DocPart>
 
         if func.raises:
-            doc_raises = <DocPart kind="function" subkind="raises" id_prefix={id_prefix} level={self.h_level+1} open>
+            raises_id_prefix = f"{id_prefix}-raises-"
+            doc_raises = <DocPart kind="function" subkind="raises" id_prefix={id_prefix} level={part_level} open>
                 <DocHeader menu="Raises">Raises</DocHeader>
                 {[
-                    <NamedValue value={raise_info} h_level={self.h_level+2} id_prefix="{id_prefix}-raises-" />
+                    <NamedValue value={raise_info} h_level={item_level} id_prefix={raises_id_prefix} />
                     for raise_info
                     in func.raises
                 ]}
             </DocPart>
 
         if func.example:
-            doc_example = <DocPart kind="function" subkind="example" id_prefix={id_prefix} level={self.h_level+1} open>
+            doc_example = <DocPart kind="function" subkind="example" id_prefix={id_prefix} level={part_level} open>
                 <DocHeader menu="Example">Example</DocHeader>
                 <Code code={func.example} />
             </DocPart>
 
-        return <DocPart kind="function" id_prefix={id_prefix} level={self.h_level} open={self.open} class="function-{kind}">
+        return <DocPart kind="function" id_prefix={id_prefix} level={h_level} open={self.open} class="function-{kind}">
             <DocHeader menu={func.name} menu-class="menu-function-{kind}">
                 <if cond={kind not in ('method', 'function')}>
                     <span class="function-kind">@{kind}<br /></span>
@@ -27,15 +27,13 @@ class Class(_BaseContainer):
             comment(): f"</{cls.__module__}.{cls.__name__}>",
         })
 
-    def render_content(self, id_prefix, context):
-        children_before, content, children_after = super().render_content(id_prefix, context)
-
+    def render_doc_parts(self, id_prefix, context):
         doc_proptypes = None
         obj = self.obj
         if obj.proptypes:
             doc_proptypes = <PropTypes obj={obj.proptypes} id_prefix={id_prefix} h_level={self.h_level+1} />
 
-        return children_before, doc_proptypes, content, children_after
+        return (doc_proptypes, *super().render_doc_parts(id_prefix, context))
 
 
 
@@ -64,18 +64,17 @@ class Module(_BaseContainer):
             comment(): f"</{cls.__module__}.{cls.__name__}>",
         })
 
-    def render_content(self, id_prefix, context):
-        children_before, content, children_after = super().render_content(id_prefix, context)
-
+    def render_doc_parts(self, id_prefix, context):
         doc_classes = None
         obj = self.obj
         if obj.classes:
+            classes_id_prefix = f"{id_prefix}-classes-"
             doc_classes = <DocPart kind={self.__kind__} subkind="classes" id_prefix={id_prefix} level={self.h_level+1} open>
                 <DocHeader menu="Classes">Classes</DocHeader>
                 {[
-                    <Class obj={klass} h_level={self.h_level+2} id_prefix="{id_prefix}-classes-" open open_doc_details=False/>
+                    <Class obj={klass} h_level={self.h_level+2} id_prefix={classes_id_prefix} open open_doc_details=False/>
                     for klass in obj.classes
                 ]}
             </DocPart>
 
-        return children_before, content, doc_classes, children_after
+        return (*super().render_doc_parts(id_prefix, context), doc_classes)
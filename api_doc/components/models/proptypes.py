@@ -55,19 +55,21 @@ class PropTypes(Element):
                 <Code code={proptypes.example} />
             </DocPart>
 
-        doc_props = lambda h_level: [
-            <NamedValue value={proptype} h_level={h_level} id_prefix="{id_prefix}-props-"/>
+        props_level = self.h_level + (2 if doc_example else 1)
+        props_id_prefix = f"{id_prefix}-props-"
+        doc_props = [
+            <NamedValue value={proptype} h_level={props_level} id_prefix={props_id_prefix}/>
             for proptype in proptypes.props
         ]
 
         if doc_example:
             doc_props = <DocPart kind="prop_types" subkind="props" id_prefix={id_prefix} level={self.h_level+1} open>
                 <DocHeader menu="Props">Props</DocHeader>
-                {doc_props(self.h_level+2)}
+                {doc_props}
             </DocPart>
         else:
             doc_props = <div class="prop_types-props">
-                {doc_props(self.h_level+1)}
+                {doc_props}
             </div>
 
         return <DocPart kind="prop_types" id_prefix={id_prefix} level={self.h_level} open>
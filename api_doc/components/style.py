@@ -1,4 +1,4 @@
-from typing import Callable, List, Dict
+from typing import Callable, Dict, Tuple
 
 from mixt import Element, html, Required
 from mixt.contrib.css import css_vars
@@ -7,7 +7,7 @@ from mixt.contrib.css.vars import CSS_VARS
 from mixt.internal.base import OptionalContext, BaseContext
 
 
-__colors__: List[str] = [
+__colors__: Tuple[str, ...] = (
         "white",
         "#f7fcf0",
         "#e0f3db",
@@ -18,7 +18,7 @@ __colors__: List[str] = [
         "#2b8cbe",
         "#0868ac",
         "#084081",
-]
+)
 
 
 # noinspection PyUnresolvedReferences
@@ -46,7 +46,7 @@ def get_extends():
 
 
 class Styles:
-    colors: List[str] = __colors__
+    colors: Tuple[str, ...] = __colors__
     breakpoint: QuantifiedUnit = CSS_VARS.rem(50)
 
 
@@ -1,4 +1,3 @@
-from contextlib import contextmanager
 from os import environ
 import os.path
 import sys
@@ -21,20 +20,41 @@ def error(text):
     exit(1)
 
 
-@contextmanager
-def log_rendering(path, title, counter):
-    counter['files_count'] += 1
-    files_count_str = ("{:" + counter['files_chars_len'] + "}").format(counter['files_count'])
-    title = f" [{title}]" if title else ""
-    print_line = f"[{files_count_str}/{counter['files_total_str']}] Writing {path}{title}"
+class LogRendering:
+    def __init__(self, path, title, counter):
+        counter['files_count'] += 1
+        files_count_str = counter['files_count_format'](counter['files_count'])
+        title = f" [{title}]" if title else ""
+        self.print_line = f"[{files_count_str}/{counter['files_total_str']}] {path}{title}"
+        self.counter = counter
+        self.length = 0
+        self.written = False
 
-    print(f"{print_line}...", end="")
-    sys.stdout.flush()
+    def __enter__(self):
+        print(f"{self.print_line}...", end="")
+        sys.stdout.flush()
+        return self
 
-    length = yield
-    yield
+    def report(self, length, written):
+        self.length = length
+        self.written = written
 
-    print(f'\r{print_line} - {length} bytes [ok]')
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.counter['written_count' if self.written else 'unchanged_count'] += 1
+            print(f'\r{self.print_line} - {self.length} bytes [{"written" if self.written else "unchanged"}]')
+
+
+def write_if_changed(path, content):
+    if os.path.exists(path):
+        with open(path) as file:
+            if file.read() == content:
+                return False
+
+    with open(path, 'w') as file:
+        file.write(content)
+
+    return True
 
 
 def main(directory):
@@ -49,26 +69,27 @@ def main(directory):
 
     files = files_to_render()
 
-    files_chars_len = str(len(str(len(files))))
+    files_count_format = ("{:" + str(len(str(len(files)))) + "}").format
     counter = {
         'files_count': 0,
-        'files_chars_len': files_chars_len,
-        'files_total_str': ("{:" + files_chars_len + "}").format(len(files)),
+        'files_count_format': files_count_format,
+        'files_total_str': files_count_format(len(files)),
+        'written_count': 0,
+        'unchanged_count': 0,
     }
 
     for filename, title, callable, args in files:
 
         path = os.path.join(directory, filename)
 
-        log_renderer = log_rendering(path, title, counter)
-        with log_renderer:
-
-            with open(path, 'w') as file:
-                content = str(callable(**args))
-                file.write(content)
-                log_renderer.gen.send(len(content))
+        with LogRendering(path, title, counter) as log_renderer:
+            content = str(callable(**args))
+            log_renderer.report(len(content), write_if_changed(path, content))
 
-    print(f"\nSuccessfully wrote {counter['files_count']} files to `{directory}`.")
+    print(
+        f"\nSuccessfully wrote {counter['written_count']} files to `{directory}`"
+        f" ({counter['unchanged_count']} unchanged files left as is)."
+    )
 
 
 if __name__ == "__main__":
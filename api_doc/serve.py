@@ -15,10 +15,20 @@ def setup_routing(app: Bottle):
             elif filename.endswith('.css'):
                 content_type = "text/css"
 
+            # the css/js collected from the pages depend on the pages already rendered, so
+            # only the pages themselves, always rendered the same way, can be cached
+            cacheable = filename.endswith('.html')
+            cache = {}
+
             def callback():
                 if content_type:
                     response.content_type = content_type
-                return str(callable(**args))
+                if 'content' in cache:
+                    return cache['content']
+                content = str(callable(**args))
+                if cacheable:
+                    cache['content'] = content
+                return content
 
             return callback
 
@@ -2,9 +2,6 @@
 
 from os import path
 
-import pkg_resources
-from setuptools.config import read_configuration
-
 from . import exceptions, html as h  # noqa: F401
 from .element import Element, ElementProxy  # noqa: F401
 from .internal import dev_mode  # noqa: F401,F403  # pylint: disable=wildcard-import
@@ -19,19 +16,35 @@ def _extract_version() -> str:
 
     It will get it from the installed package if any, of from the ``setup.cfg`` file.
 
+    The slow to import ``pkg_resources`` and ``setuptools`` are only imported if needed: the
+    installed package version is read via ``importlib.metadata`` when available (python 3.8+).
+
     Returns
     -------
     str
         The actual version of the ``mixt`` package.
 
     """
+    # pylint: disable=import-outside-toplevel
     try:
-        return pkg_resources.get_distribution("mixt").version
-    except pkg_resources.DistributionNotFound:
-        _conf = read_configuration(
-            path.join(path.dirname(__file__), "../../", "setup.cfg")
-        )
-        return _conf["metadata"]["version"]
+        from importlib import metadata  # type: ignore
+    except ImportError:  # python < 3.8
+        import pkg_resources
+
+        try:
+            return pkg_resources.get_distribution("mixt").version
+        except pkg_resources.DistributionNotFound:
+            pass
+    else:
+        try:
+            return metadata.version("mixt")
+        except metadata.PackageNotFoundError:
+            pass
+
+    from setuptools.config import read_configuration
+
+    _conf = read_configuration(path.join(path.dirname(__file__), "../../", "setup.cfg"))
+    return _conf["metadata"]["version"]
 
 
 __version__ = _extract_version()
@@ -12,6 +12,25 @@ from ..exceptions import BadCharError, ParserStateError
 from .state import State
 
 
+# For these states, every character but the given ones is simply accumulated, so runs of other
+# characters can be passed at once to ``HTMLTokenizer.feed_run``.
+RUN_STATES_STOP_CHARS = {
+    State.DATA: '<',
+    State.ATTRIBUTE_VALUE_DOUBLE_QUOTED: '"',
+    State.ATTRIBUTE_VALUE_SINGLE_QUOTED: "'",
+    State.COMMENT: '-',
+    State.DOCTYPE_CONTENTS: '>',
+}
+
+QUOTED_ATTRIBUTE_VALUE_STATES = frozenset({
+    State.ATTRIBUTE_VALUE_DOUBLE_QUOTED,
+    State.ATTRIBUTE_VALUE_SINGLE_QUOTED,
+})
+ATTRIBUTE_VALUE_STATES = QUOTED_ATTRIBUTE_VALUE_STATES | {State.ATTRIBUTE_VALUE_UNQUOTED}
+# States where python ``**kwargs`` are accepted in a tag.
+KWARGS_STATES = frozenset({State.BEFORE_ATTRIBUTE_NAME, State.AFTER_ATTRIBUTE_NAME})
+
+
 class Tag(object):
     def __init__(self):
         self.tag_name = None
@@ -103,8 +122,17 @@ class HTMLTokenizer(object):
         else:
             build.append(c)
 
+    def feed_run(self, run):
+        """ Feed many characters at once, for a state in ``RUN_STATES_STOP_CHARS`` and a run not
+        containing any of its stop characters """
+        if self.state in QUOTED_ATTRIBUTE_VALUE_STATES:
+            self.add_data_char(self.attribute_value, run)
+        else:
+            self.data += run
+
     def feed(self, c):
-        if self.state == State.DATA:
+        state = self.state
+        if state == State.DATA:
             if c == '<':
                 self.emit_data()
                 self.state = State.TAG_OPEN
@@ -114,7 +142,7 @@ class HTMLTokenizer(object):
             else:
                 self.data += c
 
-        elif self.state == State.TAG_OPEN:
+        elif state == State.TAG_OPEN:
             self.tag = Tag()
             if c == '!':
                 self.markup_declaration_buffer = ""
@@ -127,7 +155,7 @@ class HTMLTokenizer(object):
             else:
                 raise BadCharError(self.state, c)
 
-        elif self.state == State.END_TAG_OPEN:
+        elif state == State.END_TAG_OPEN:
             self.tag.endtag = True
             if c.isalpha():
                 self.tag.tag_name = c
@@ -135,7 +163,7 @@ class HTMLTokenizer(object):
             else:
                 raise BadCharError(self.state, c)
 
-        elif self.state == State.TAG_NAME:
+        elif state == State.TAG_NAME:
             if c in '\t\n\f ':
                 self.state = State.BEFORE_ATTRIBUTE_NAME
             elif c == '/':
@@ -146,7 +174,7 @@ class HTMLTokenizer(object):
             else:
                 self.tag.tag_name += c
 
-        elif self.state == State.BEFORE_ATTRIBUTE_NAME:
+        elif state == State.BEFORE_ATTRIBUTE_NAME:
             if c in '\t\n\f ':
                 pass
             elif c == '/':
@@ -160,7 +188,7 @@ class HTMLTokenizer(object):
                 self.attribute_name = c.lower()
                 self.state = State.ATTRIBUTE_NAME
 
-        elif self.state == State.ATTRIBUTE_NAME:
+        elif state == State.ATTRIBUTE_NAME:
             if c in '\t\n\f ':
                 self.state = State.AFTER_ATTRIBUTE_NAME
             elif c == '/':
@@ -177,7 +205,7 @@ class HTMLTokenizer(object):
             else:
                 self.attribute_name += c.lower()
 
-        elif self.state == State.AFTER_ATTRIBUTE_NAME:
+        elif state == State.AFTER_ATTRIBUTE_NAME:
             if c in '\t\n\f ':
                 pass
             elif c == '/':
@@ -196,7 +224,7 @@ class HTMLTokenizer(object):
                 self.attribute_name = c.lower()
                 self.state = State.ATTRIBUTE_NAME
 
-        elif self.state == State.BEFORE_ATTRIBUTE_VALUE:
+        elif state == State.BEFORE_ATTRIBUTE_VALUE:
             if c in '\t\n\f ':
                 pass
             elif c == '"':
@@ -215,7 +243,7 @@ class HTMLTokenizer(object):
                 self.attribute_value = [c]
                 self.state = State.ATTRIBUTE_VALUE_UNQUOTED
 
-        elif self.state == State.ATTRIBUTE_VALUE_DOUBLE_QUOTED:
+        elif state == State.ATTRIBUTE_VALUE_DOUBLE_QUOTED:
             if c == '"':
                 self.state = State.AFTER_ATTRIBUTE_VALUE
             # Pass through; it's the browser's problem to understand these.
@@ -224,7 +252,7 @@ class HTMLTokenizer(object):
             else:
                 self.add_data_char(self.attribute_value, c)
 
-        elif self.state == State.ATTRIBUTE_VALUE_SINGLE_QUOTED:
+        elif state == State.ATTRIBUTE_VALUE_SINGLE_QUOTED:
             if c == "'":
                 self.state = State.AFTER_ATTRIBUTE_VALUE
             # Pass through; it's the browser's problem to understand these.
@@ -233,7 +261,7 @@ class HTMLTokenizer(object):
             else:
                 self.add_data_char(self.attribute_value, c)
 
-        elif self.state == State.ATTRIBUTE_VALUE_UNQUOTED:
+        elif state == State.ATTRIBUTE_VALUE_UNQUOTED:
             if c in '\t\n\f ':
                 self.got_attribute()
                 self.state = State.BEFORE_ATTRIBUTE_NAME
@@ -252,7 +280,7 @@ class HTMLTokenizer(object):
             else:
                 self.add_data_char(self.attribute_value, c)
 
-        elif self.state == State.AFTER_ATTRIBUTE_VALUE:
+        elif state == State.AFTER_ATTRIBUTE_VALUE:
             self.got_attribute()
             if c in '\t\n\f ':
                 self.state = State.BEFORE_ATTRIBUTE_NAME
@@ -264,7 +292,7 @@ class HTMLTokenizer(object):
             else:
                 raise BadCharError(self.state, c)
 
-        elif self.state == State.SELF_CLOSING_START_TAG:
+        elif state == State.SELF_CLOSING_START_TAG:
             self.tag.startendtag = True
             if c == '>':
                 self.emit_tag()
@@ -272,7 +300,7 @@ class HTMLTokenizer(object):
             else:
                 raise BadCharError(self.state, c)
 
-        elif self.state == State.MARKUP_DECLARATION_OPEN:
+        elif state == State.MARKUP_DECLARATION_OPEN:
             self.markup_declaration_buffer += c
             if self.markup_declaration_buffer == "--":
                 self.data = ""
@@ -288,7 +316,7 @@ class HTMLTokenizer(object):
                       "[CDATA[".startswith(self.markup_declaration_buffer)):
                 raise BadCharError(self.state, c)
 
-        elif self.state == State.COMMENT_START:
+        elif state == State.COMMENT_START:
             if c == "-":
                 self.state = State.COMMENT_START_DASH
             elif c == ">":
@@ -297,7 +325,7 @@ class HTMLTokenizer(object):
                 self.data += c
                 self.state = State.COMMENT
 
-        elif self.state == State.COMMENT_START_DASH:
+        elif state == State.COMMENT_START_DASH:
             if c == "-":
                 self.state = State.COMMENT_END
             elif c == ">":
@@ -306,41 +334,41 @@ class HTMLTokenizer(object):
                 self.data += "-" + c
                 self.state = State.COMMENT
 
-        elif self.state == State.COMMENT:
+        elif state == State.COMMENT:
             if c == "-":
                 self.state = State.COMMENT_END_DASH
             else:
                 self.data += c
 
-        elif self.state == State.COMMENT_END_DASH:
+        elif state == State.COMMENT_END_DASH:
             if c == "-":
                 self.state = State.COMMENT_END
             else:
                 self.data += "-" + c
                 self.state = State.COMMENT
 
-        elif self.state == State.COMMENT_END:
+        elif state == State.COMMENT_END:
             if c == ">":
                 self.emit_comment()
                 self.state = State.DATA
             else:
                 raise BadCharError(self.state, c)
 
-        elif self.state == State.DOCTYPE:
+        elif state == State.DOCTYPE:
             if c in "\t\n\f ":
                 self.data = ""
                 self.state = State.DOCTYPE_CONTENTS
             else:
                 raise BadCharError(self.state, c)
 
-        elif self.state == State.DOCTYPE_CONTENTS:
+        elif state == State.DOCTYPE_CONTENTS:
             if c == ">":
                 self.emit_doctype()
                 self.state = State.DATA
             else:
                 self.data += c
 
-        elif self.state == State.CDATA_SECTION:
+        elif state == State.CDATA_SECTION:
             self.cdata_buffer += c
             if self.cdata_buffer == "]]>":
                 self.emit_cdata()
@@ -357,12 +385,9 @@ class HTMLTokenizer(object):
         if self.state == State.BEFORE_ATTRIBUTE_VALUE:
             self.attribute_value = [tokens]
             self.state = State.ATTRIBUTE_VALUE_UNQUOTED
-        elif self.state in [State.ATTRIBUTE_VALUE_DOUBLE_QUOTED,
-                            State.ATTRIBUTE_VALUE_SINGLE_QUOTED,
-                            State.ATTRIBUTE_VALUE_UNQUOTED]:
+        elif self.state in ATTRIBUTE_VALUE_STATES:
             self.attribute_value.append(tokens)
-        elif self.state in [State.BEFORE_ATTRIBUTE_NAME,
-                            State.AFTER_ATTRIBUTE_NAME]:
+        elif self.state in KWARGS_STATES:
             self.tag.kwargs_attrs.append([tokens])
         else:
             raise ParserStateError(self.state, "Python not allowed here")
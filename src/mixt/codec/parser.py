@@ -1,35 +1,107 @@
+import re
 import tokenize
+from functools import lru_cache
 
 from mixt import html
 from mixt.exceptions import ParserStateError, ParserError, RequiredPropError, InvalidPropNameError
-from mixt.internal.base import escape
 from mixt.internal.html import __tags__
 from mixt.internal.proptypes import BasePropTypes
-from .html_tokenizer import HTMLTokenizer
+from .html_tokenizer import (
+    ATTRIBUTE_VALUE_STATES, KWARGS_STATES, RUN_STATES_STOP_CHARS, HTMLTokenizer,
+)
 from mixt.codec.state import State
 from .pytokenize import Untokenizer
 
 
+# For states accepting runs of characters, find the next one that must be fed on its own: a stop
+# char of the state, or a new line that we need to update the position.
+RUN_STOP_REGEXES = {
+    state: re.compile('[%s\n]' % re.escape(chars))
+    for state, chars in RUN_STATES_STOP_CHARS.items()
+}
+
+# Output to start the call of each tag that is in ``mixt.html``: the lower-cased html tags, and
+# the other names (but not html tags in another case, which are expected to be user components).
+HTML_TAGS_CALLS = {
+    **{name: f'html.{name}(' for name in dir(html) if name.lower() not in __tags__},
+    **{tag: f'html.{name}(' for tag, name in __tags__.items()},
+}
+
+# Attributes values that are passed as python values and not as strings.
+LITERAL_ATTR_VALUES = frozenset({'True', 'False', 'None', 'NotProvided'})
+# Numbers are also passed as python values. This is the start of such attributes values.
+NUMBER_START = re.compile(r'\s*[-+.\d]')
+
+# States where python can be fed as a child or as an attribute value (see also ``KWARGS_STATES``).
+PYTHON_DATA_STATES = frozenset({State.DATA, State.CDATA_SECTION})
+PYTHON_ATTRIBUTE_VALUE_STATES = ATTRIBUTE_VALUE_STATES | {State.BEFORE_ATTRIBUTE_VALUE}
+# States where a ``#`` starts a python comment.
+PYTHON_COMMENT_STATES = frozenset({
+    State.DATA, State.TAG_NAME,
+    State.BEFORE_ATTRIBUTE_NAME, State.AFTER_ATTRIBUTE_NAME,
+    State.BEFORE_ATTRIBUTE_VALUE, State.AFTER_ATTRIBUTE_VALUE,
+    State.COMMENT, State.DOCTYPE_CONTENTS, State.CDATA_SECTION,
+})
+# States where the tokenizer ignores whitespace, so we don't have to feed it.
+SPACE_IGNORED_STATES = frozenset({
+    State.BEFORE_ATTRIBUTE_NAME, State.AFTER_ATTRIBUTE_NAME, State.BEFORE_ATTRIBUTE_VALUE,
+})
+
+NEW_LINES_TO_SPACES = str.maketrans('\r\n', '  ')
+# Characters changed by ``mixt.internal.base.escape``: data containing them must be passed as raw.
+TO_ESCAPE = re.compile('[&<>"]')
+
+
+@lru_cache(maxsize=512)
+def attr_name_to_python(attr_name):
+    """Cached version of ``BasePropTypes.__to_python__``, as the same names are used again and again.
+    Names raising ``NameError`` are not cached."""
+    return BasePropTypes.__to_python__(attr_name)
+
+
 class PyxlParser(HTMLTokenizer):
     def __init__(self, row, col, str_function):
         super().__init__()
-        self.start = self.end = (row, col)
+        self.start = (row, col)
+        self.end_row, self.end_col = row, col
         self.output = []
+        self.last_comma_index = None
         self.open_tags = []
         self.remainder = None
         self.next_thing_is_python = False
         self.last_thing_was_python = False
         self.last_thing_was_close_if_tag = False
         self.str_function = str_function
+        self.untokenizer = Untokenizer()
+
+    @property
+    def end(self):
+        """Current position, as a ``(row, col)`` tuple, only created when asked."""
+        return (self.end_row, self.end_col)
+
+    @end.setter
+    def end(self, position):
+        self.end_row, self.end_col = position
+
+    def untokenize(self, tokens):
+        """Transform python tokens back into source code, reusing the same untokenizer."""
+        untokenizer = self.untokenizer
+        untokenizer.reset()
+        return untokenizer.untokenize(tokens)
+
+    def append_with_comma(self, part):
+        """Append a part ending with a comma, keeping its position for ``delete_last_comma``."""
+        self.last_comma_index = len(self.output)
+        self.output.append(part)
 
     def delete_last_comma(self):
-        for i in reversed(range(len(self.output))):
-            stripped = self.output[i].rstrip()
-            if stripped and not stripped[0] == '#':
-                assert stripped[-1] == ',', (self.output, stripped, i)
-                self.output[i] = self.output[i][:len(stripped)-1] + self.output[i][len(stripped):]
-                return
-        assert False, "couldn't find a comma"
+        index = self.last_comma_index
+        assert index is not None, "couldn't find a comma"
+        part = self.output[index]
+        stripped = part.rstrip()
+        assert stripped[-1] == ',', (self.output, stripped, index)
+        self.output[index] = stripped[:-1] + part[len(stripped):]
+        self.last_comma_index = None
 
     def handle_close_if(self):
         """Clean up after an unpaired if statement.
@@ -37,7 +109,7 @@ class PyxlParser(HTMLTokenizer):
         """
         if self.last_thing_was_close_if_tag:
             self.delete_last_comma()
-            self.output.append(' else None, ')
+            self.append_with_comma(' else None, ')
             self.last_thing_was_close_if_tag = False
 
     def start_element(self):
@@ -47,32 +119,51 @@ class PyxlParser(HTMLTokenizer):
         if self.open_tags:
             self.open_tags[-1]['children'] += 1
 
-    def feed(self, token):
-        ttype, tvalue, tstart, tend, tline = token
-
-        assert tstart[0] >= self.end[0], "row went backwards"
-        if tstart[0] > self.end[0]:
-            self.output.append("\n" * (tstart[0] - self.end[0]))
+    def move_to(self, position):
+        """Move to the given position, handling the whitespace between the current one and it."""
+        row, col = position
+        assert row >= self.end_row, "row went backwards"
+        if row > self.end_row:
+            self.output.append("\n" * (row - self.end_row))
 
-        # interpret jumps on the same line as a single space
-        elif tstart[1] > self.end[1]:
+        # interpret jumps on the same line as a single space (if not ignored in the current state)
+        elif col > self.end_col and self.state not in SPACE_IGNORED_STATES:
             super().feed(" ")
 
-        self.end = tstart
+        self.end_row, self.end_col = row, col
+
+    def feed(self, token):
+        ttype, tvalue, tstart, tend, tline = token
+
+        self.move_to(tstart)
 
+        pos = 0
         if ttype != tokenize.INDENT:
-            while tvalue and not self.done():
-                c, tvalue = tvalue[0], tvalue[1:]
+            length = len(tvalue)
+            while pos < length and not self.done():
+                stop_regex = RUN_STOP_REGEXES.get(self.state)
+                if stop_regex is not None:
+                    match = stop_regex.search(tvalue, pos)
+                    stop = match.start() if match else length
+                    if stop > pos:
+                        # no new line in the run so we stay on the same row
+                        self.feed_run(tvalue[pos:stop])
+                        self.end_col += stop - pos
+                        pos = stop
+                        continue
+                c = tvalue[pos]
+                pos += 1
                 if c == "\n":
-                    self.end = (self.end[0]+1, 0)
+                    self.end_row += 1
+                    self.end_col = 0
                 else:
-                    self.end = (self.end[0], self.end[1]+1)
+                    self.end_col += 1
                 try:
                     super().feed(c)
                 except ParserStateError as exc:
                     raise ParserError("HTML Parsing error", self.end, exc)
         if self.done():
-            self.remainder = (ttype, tvalue, self.end, tend, tline)
+            self.remainder = (ttype, tvalue[pos:], self.end, tend, tline)
         else:
             self.end = tend
 
@@ -80,31 +171,27 @@ class PyxlParser(HTMLTokenizer):
         self.handle_close_if()
 
         ttype, tvalue, tstart, tend, tline = tokens[0]
-        assert tstart[0] >= self.end[0], "row went backwards"
-        if tstart[0] > self.end[0]:
-            self.output.append("\n" * (tstart[0] - self.end[0]))
+        assert tstart[0] >= self.end_row, "row went backwards"
+        if tstart[0] > self.end_row:
+            self.output.append("\n" * (tstart[0] - self.end_row))
         ttype, tvalue, tstart, tend, tline = tokens[-1]
         self.end = tend
 
-        if self.state in [State.DATA, State.CDATA_SECTION]:
+        if self.state in PYTHON_DATA_STATES:
             self.next_thing_is_python = True
             self.emit_data()
-            output = Untokenizer().untokenize(tokens)
+            output = self.untokenize(tokens)
             # If we have a generator comprehension, parenthesize it
             if has_bare_generator(tokens):
-                self.output.append("(%s), " % output)
+                self.append_with_comma(f"({output}), ")
             else:
-                self.output.append("%s, " % output)
+                self.append_with_comma(f"{output}, ")
             self.next_thing_is_python = False
             self.last_thing_was_python = True
             self.start_element()
-        elif self.state in [State.BEFORE_ATTRIBUTE_VALUE,
-                            State.ATTRIBUTE_VALUE_DOUBLE_QUOTED,
-                            State.ATTRIBUTE_VALUE_SINGLE_QUOTED,
-                            State.ATTRIBUTE_VALUE_UNQUOTED]:
+        elif self.state in PYTHON_ATTRIBUTE_VALUE_STATES:
             super().feed_python(tokens)
-        elif self.state in [State.BEFORE_ATTRIBUTE_NAME,
-                            State.AFTER_ATTRIBUTE_NAME]:
+        elif self.state in KWARGS_STATES:
             # will only allow **somedict kind of python
             super().feed_python(tokens)
         else:
@@ -114,7 +201,7 @@ class PyxlParser(HTMLTokenizer):
         """update with any whitespace we might have missed, and advance position to after the
         token"""
         ttype, tvalue, tstart, tend, tline = token
-        self.feed((ttype, '', tstart, tstart, tline))
+        self.move_to(tstart)
         self.end = tend
 
     def python_comment_allowed(self):
@@ -127,21 +214,18 @@ class PyxlParser(HTMLTokenizer):
             Link text
         </a>
         """
-        return self.state in (State.DATA, State.TAG_NAME,
-                              State.BEFORE_ATTRIBUTE_NAME, State.AFTER_ATTRIBUTE_NAME,
-                              State.BEFORE_ATTRIBUTE_VALUE, State.AFTER_ATTRIBUTE_VALUE,
-                              State.COMMENT, State.DOCTYPE_CONTENTS, State.CDATA_SECTION)
+        return self.state in PYTHON_COMMENT_STATES
 
     def python_mode_allowed(self):
         """Returns true if we're in a state where a { starts python mode.
 
         <!-- {this isn't python} -->
         """
-        return self.state not in (State.COMMENT,)
+        return self.state != State.COMMENT
 
     def feed_comment(self, token):
         ttype, tvalue, tstart, tend, tline = token
-        self.feed((ttype, '', tstart, tstart, tline))
+        self.move_to(tstart)
         self.output.append(tvalue)
         self.end = tend
 
@@ -155,31 +239,20 @@ class PyxlParser(HTMLTokenizer):
         return (tokenize.STRING, ''.join(self.output), self.start, self.end, '')
 
     def _handle_attr_value(self, attr_value):
-        def format_parts():
-            prev_was_python = False
-            for i, part in enumerate(attr_value):
-                if type(part) == list:
-                    yield part
-                    prev_was_python = True
-                else:
-                    next_is_python = bool(i+1 < len(attr_value) and type(attr_value[i+1]) == list)
-                    part = self._normalize_data_whitespace(part, prev_was_python, next_is_python)
-                    if part:
-                        yield part
-                    prev_was_python = False
-
         def format_part(part):
             """Allow numbers, bools, None and NotProvided to be passed without being stringified."""
-            if part in {'True', 'False', 'None', 'NotProvided'}:
+            if part in LITERAL_ATTR_VALUES:
                 return part
             if part.isdecimal():
                 return part
-            try:
-                float(part)
-            except:
-                pass
-            else:
-                return part
+            # only try to convert to float what may be a number, to avoid exceptions for usual text
+            if NUMBER_START.match(part):
+                try:
+                    float(part)
+                except:
+                    pass
+                else:
+                    return part
 
             return repr(part)
 
@@ -188,24 +261,35 @@ class PyxlParser(HTMLTokenizer):
         if attr_value is True:
             # special case where we force the value to True for attributes without value
             output.append('True')
+        elif len(attr_value) == 1 and isinstance(attr_value[0], str):
+            # fast path for the common case of a simple string value
+            part = self._normalize_data_whitespace(attr_value[0], False, False)
+            output.append(format_part(part) if part else '"".join(())')
         else:
-            attr_value = list(format_parts())
-            if len(attr_value) == 1:
-                part = attr_value[0]
-                if type(part) == list:
-                    output.append(Untokenizer().untokenize(part))
+            # convert all parts in one pass, remembering which ones are python
+            parts = []
+            prev_was_python = False
+            last_index = len(attr_value) - 1
+            for i, part in enumerate(attr_value):
+                if isinstance(part, list):
+                    parts.append((True, self.untokenize(part)))
+                    prev_was_python = True
                 else:
-                    output.append(format_part(part))
+                    next_is_python = i < last_index and isinstance(attr_value[i+1], list)
+                    part = self._normalize_data_whitespace(part, prev_was_python, next_is_python)
+                    if part:
+                        parts.append((False, format_part(part)))
+                    prev_was_python = False
+
+            if len(parts) == 1:
+                output.append(parts[0][1])
             else:
                 output.append('"".join((')
-                for part in attr_value:
-                    if type(part) == list:
-                        output.append('{}('.format(self.str_function))
-                        output.append(Untokenizer().untokenize(part))
-                        output.append(')')
+                for is_python, part in parts:
+                    if is_python:
+                        output.append(f'{self.str_function}({part}), ')
                     else:
-                        output.append(format_part(part))
-                    output.append(', ')
+                        output.append(f'{part}, ')
                 output.append('))')
 
         return output
@@ -214,19 +298,16 @@ class PyxlParser(HTMLTokenizer):
     def _normalize_data_whitespace(data, prev_was_py, next_is_py):
         if not data:
             return ''
-        if '\n' in data and not data.strip():
+        if '\n' not in data:
+            return data.translate(NEW_LINES_TO_SPACES)
+        if data.isspace():
             if prev_was_py and next_is_py:
                 return ' '
             else:
                 return ''
-        if prev_was_py and data.startswith('\n'):
-                data = " " + data.lstrip('\n')
-        if next_is_py and data.endswith('\n'):
-                data = data.rstrip('\n') + " "
-        data = data.strip('\n')
-        data = data.replace('\r', ' ')
-        data = data.replace('\n', ' ')
-        return data
+        start = " " if prev_was_py and data.startswith('\n') else ""
+        end = " " if next_is_py and data.endswith('\n') else ""
+        return start + data.strip('\n').translate(NEW_LINES_TO_SPACES) + end
 
     def handle_starttag(self, tag, attrs, kwargs_attrs=None, call=True):
         self.start_element()
@@ -263,35 +344,19 @@ class PyxlParser(HTMLTokenizer):
 
         self.handle_close_if()
 
-        tag_lower = tag.lower()
-        if tag == tag_lower and tag_lower in __tags__:
-            # allow only lower-cased tags in html
-            self.output.append('html.%s(' % __tags__[tag_lower])
-        elif hasattr(html, tag) and tag_lower not in __tags__:
-            # or other in html but not html tags: just "special" tags
-            self.output.append('html.%s(' % tag)
-        else:
-            self.output.append('%s(' % tag)
+        self.output.append(HTML_TAGS_CALLS.get(tag) or f'{tag}(')
 
-        first_attr = True
+        props = []
         for attr_name, attr_value in attrs.items():
-            if first_attr: first_attr = False
-            else: self.output.append(', ')
-
             try:
-                safe_attr_name = BasePropTypes.__to_python__(attr_name)
+                safe_attr_name = attr_name_to_python(attr_name)
             except NameError:
                 raise ParserError(f"Invalid prop name {attr_name}", self.start)
 
-            self.output.append(safe_attr_name)
-            self.output.append('=')
-            self.output.extend(self._handle_attr_value(attr_value))
+            props.append(f"{safe_attr_name}={''.join(self._handle_attr_value(attr_value))}")
 
         if kwargs_attrs:
             for kwargs_attr in kwargs_attrs:
-                if first_attr: first_attr = False
-                else: self.output.append(', ')
-
                 handled_kwargs_attr = ''.join(self._handle_attr_value(kwargs_attr))
                 left_striped_handled_kwargs_attr = handled_kwargs_attr.lstrip()
 
@@ -300,12 +365,10 @@ class PyxlParser(HTMLTokenizer):
                     col = kwargs_attr[0][0][2][1] + len(handled_kwargs_attr) - len(left_striped_handled_kwargs_attr) + 1
                     raise ParserError("Only **kwargs style is allowed here", (line, col))
 
-                self.output.append(handled_kwargs_attr)
+                props.append(handled_kwargs_attr)
 
-        self.output.append(')')
-        if call:
-            # start call to __call__
-            self.output.append('(')
+        # emit all the props at once, and also start call to __call__ if asked
+        self.output.append(', '.join(props) + (')(' if call else ')'))
         self.last_thing_was_python = False
         self.last_thing_was_close_if_tag = False
 
@@ -322,7 +385,7 @@ class PyxlParser(HTMLTokenizer):
         if open_tag['tag'] != tag_name:
             raise ParserError(
                 f"<{open_tag['tag']}> closed by </{tag_name}> on "
-                f"[line={self.end[0]}, col={self.end[1]}]", open_tag['pos']
+                f"[line={self.end_row}, col={self.end_col}]", open_tag['pos']
             )
 
         # If we are finishing an if or an else and it only had one child, we can safely
@@ -333,22 +396,23 @@ class PyxlParser(HTMLTokenizer):
             self.output[open_tag['open']] = ''
 
         if open_tag['tag'] == 'if':
-            self.output.append(' if ')
             # If another if/else appears in the condition, we need to parenthesize it.
-            # Detect this in a bad but easy way that might have some false positives.
-            start = len(self.output)
-            self.output.append('(')
-            self.output.extend(self._handle_attr_value(open_tag['attrs']['cond']))
-            if 'else' in ''.join(self.output[start:]):
-                self.output.append(')')
+            # Detect this in a bad but easy way that might have some false positives: we look
+            # for "else" in the python tokens (including the ones of already converted pyxl).
+            cond = open_tag['attrs']['cond']
+            cond_output = ''.join(self._handle_attr_value(cond))
+            if cond is not True and any(
+                'else' in token[1] for part in cond if isinstance(part, list) for token in part
+            ):
+                self.output.append(f' if ({cond_output})')
             else:
-                self.output[start] = ''
+                self.output.append(f' if {cond_output}')
             self.last_thing_was_close_if_tag = True
         else:
             self.last_thing_was_close_if_tag = False
 
         if len(self.open_tags):
-            self.output.append(",")
+            self.append_with_comma(",")
         self.last_thing_was_python = False
 
     def handle_startendtag(self, tag_name, attrs, kwargs_attrs=None):
@@ -367,37 +431,48 @@ class PyxlParser(HTMLTokenizer):
         # XXX XXX mimics old pyxl, but this is gross and likely wrong. I'm pretty sure we actually
         # want %r instead of this crazy quote substitution and "%s".
         data = data.replace('"', '\\"')
-        if data != escape(data):
-            self.output.append('html.Raw("%s"), ' % data)
+        if TO_ESCAPE.search(data):
+            self.append_with_comma(f'html.Raw("{data}"), ')
         else:
-            self.output.append('"%s", ' % data)
+            self.append_with_comma(f'"{data}", ')
 
         self.last_thing_was_python = False
         self.last_thing_was_close_if_tag = False
 
-    def handle_comment(self, data):
-        self.handle_startendtag("Comment", {"comment": [data.strip()]})
+    def handle_single_prop_tag(self, tag_name, prop_name, value):
+        """Emit a tag without children and with only one string prop, without going through
+        the whole handling of start and end tags."""
+        self.start_element()
+        self.handle_close_if()
+        self.output.append(
+            f"html.{tag_name}({prop_name}={''.join(self._handle_attr_value([value]))})"
+        )
+        if self.open_tags:
+            self.append_with_comma(",")
         self.last_thing_was_python = False
         self.last_thing_was_close_if_tag = False
 
+    def handle_comment(self, data):
+        self.handle_single_prop_tag("Comment", "comment", data.strip())
+
     def handle_doctype(self, data):
-        self.handle_startendtag("Doctype", {"doctype": [data]})
-        self.last_thing_was_python = False
-        self.last_thing_was_close_if_tag = False
+        self.handle_single_prop_tag("Doctype", "doctype", data)
 
     def handle_cdata(self, data):
-        self.handle_startendtag("CData", {"cdata": [data]})
-        self.last_thing_was_python = False
-        self.last_thing_was_close_if_tag = False
+        self.handle_single_prop_tag("CData", "cdata", data)
+
+OPENING_BRACKETS = frozenset('({[')
+CLOSING_BRACKETS = frozenset(')}]')
+
 
 def has_bare_generator(tokens):
     nesting = 0
-    for token in tokens:
-        tvalue = token[1]
-        if tvalue in "({[":
-            nesting += 1
-        if tvalue in ")}]":
-            nesting -= 1
-        if tvalue == "for" and nesting == 0:
+    for ttype, tvalue, *_ in tokens:
+        if ttype == tokenize.OP:
+            if tvalue in OPENING_BRACKETS:
+                nesting += 1
+            elif tvalue in CLOSING_BRACKETS:
+                nesting -= 1
+        elif ttype == tokenize.NAME and nesting == 0 and tvalue == "for":
             return True
     return False
\ No newline at end of file
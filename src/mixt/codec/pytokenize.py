@@ -238,6 +238,10 @@ class Untokenizer:
     # PYXL MODIFICATION: This entire class.
 
     def __init__(self, row=None, col=None):
+        self.reset(row, col)
+
+    def reset(self, row=None, col=None):
+        """Forget all fed tokens, to be able to reuse the same instance."""
         self.tokens = []
         self.prev_row = row
         self.prev_col = col
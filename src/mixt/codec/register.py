@@ -1,6 +1,7 @@
 import codecs, io, encodings
 import traceback
 from encodings import utf_8
+from functools import lru_cache
 from .tokenizer import pyxl_tokenize, pyxl_untokenize
 
 def pyxl_transform(stream):
@@ -14,7 +15,13 @@ def pyxl_transform(stream):
     return output.rstrip()
 
 def pyxl_transform_string(input):
-    stream = io.StringIO(bytes(input).decode('utf-8'))
+    return pyxl_transform_bytes(bytes(input))
+
+@lru_cache(maxsize=128)
+def pyxl_transform_bytes(input):
+    """Cached as the same files may be decoded many times in a process (for tracebacks,
+    ``inspect.getsource``...)."""
+    stream = io.StringIO(input.decode('utf-8'))
     return pyxl_transform(stream)
 
 def pyxl_decode(input, errors='strict'):
@@ -26,8 +33,8 @@ class PyxlIncrementalDecoder(utf_8.IncrementalDecoder):
         if final:
             buff = self.buffer
             self.buffer = b''
-            return super().decode(
-                pyxl_transform_string(buff).encode('utf-8'), final=True)
+            # the transformation already decodes the utf-8 input
+            return pyxl_transform_string(buff)
         else:
             return ''
 
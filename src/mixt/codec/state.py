@@ -30,7 +30,8 @@ class State(object):
 
     @classmethod
     def state_name(cls, state_val):
-        for k, v in cls.__dict__.items():
-            if v == state_val:
-                return k
-        assert False, "impossible state value %r!" % state_val
+        assert state_val in STATES_NAMES, "impossible state value %r!" % state_val
+        return STATES_NAMES[state_val]
+
+
+STATES_NAMES = {v: k for k, v in State.__dict__.items() if isinstance(v, int)}
@@ -393,3 +393,19 @@ from .rendering import render_css  # noqa: F401
 from .units import load_css_units  # noqa: F401
 from .utils import CssDict  # noqa: F401
 from .vars import CSS_VARS as c  # noqa: F401
+
+
+__all__ = [
+    "CssDict",
+    "Modes",
+    "c",
+    "css_vars",
+    "get_default_mode",
+    "import_css",
+    "import_css_global",
+    "load_css_keywords",
+    "load_css_units",
+    "override_default_mode",
+    "render_css",
+    "set_default_mode",
+]
@@ -1,10 +1,109 @@
 """Functions used to load CSS vars."""
-from contextlib import contextmanager
-from typing import Any, Callable, Dict, Generator, List, Optional
+import builtins
+import dis
+from functools import wraps
+from threading import Lock
+from types import CodeType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from .vars import CSS_VARS, add_css_var, add_css_vars, get_css_vars_keys, load_defaults
+
+
+def get_global_names(code: CodeType) -> FrozenSet[str]:
+    """Get the names of the globals loaded by the given code, including by nested code.
+
+    The names that the code itself sets or deletes (via ``global``) are not returned, as they
+    are defined by the code and must not be handled as CSS vars.
 
-import wrapt
+    Parameters
+    ----------
+    code : CodeType
+        The code (for example ``__code__`` of a function) in which to look for globals names.
+        Code objects found in its constants (comprehensions, lambdas, nested functions...) are
+        also inspected.
+
+    Returns
+    -------
+    FrozenSet[str]
+        The names of the globals the code may load without defining them.
+
+    """
+    loaded: Set[str] = set()
+    stored: Set[str] = set()
+    codes = [code]
+    while codes:
+        current = codes.pop()
+        for instruction in dis.get_instructions(current):
+            if instruction.opname in ("LOAD_GLOBAL", "LOAD_NAME"):
+                loaded.add(instruction.argval)
+            elif instruction.opname in (
+                "STORE_GLOBAL",
+                "STORE_NAME",
+                "DELETE_GLOBAL",
+                "DELETE_NAME",
+            ):
+                stored.add(instruction.argval)
+        codes.extend(
+            const for const in current.co_consts if isinstance(const, CodeType)
+        )
+    return frozenset(loaded - stored)
 
-from .vars import CSS_VARS, add_css_var, load_defaults
+
+def is_defined(name: str, *namespaces: Dict[str, Any]) -> bool:
+    """Tell if `name` is defined in one of the given `namespaces` or in the builtins.
+
+    Parameters
+    ----------
+    name : str
+        The name to look for.
+    namespaces : Tuple[Dict[str, Any], ...]
+        The dicts in which to look for `name`.
+
+    Returns
+    -------
+    bool
+        ``True`` if `name` is defined, else ``False``.
+
+    """
+    return name in builtins.__dict__ or any(
+        name in namespace for namespace in namespaces
+    )
+
+
+def add_undefined_css_vars(
+    code: CodeType, *namespaces: Dict[str, Any]
+) -> FrozenSet[str]:
+    """Add as CSS vars the globals used in `code` that are not defined.
+
+    Parameters
+    ----------
+    code : CodeType
+        The code (for example ``__code__`` of a function) in which to look for globals names.
+    namespaces : Tuple[Dict[str, Any], ...]
+        The dicts in which the code will look for the globals.
+
+    Returns
+    -------
+    FrozenSet[str]
+        The names that were added as CSS vars.
+
+    """
+    added: Set[str] = set()
+    for name in get_global_names(code):
+        if name not in CSS_VARS and not is_defined(name, *namespaces):
+            add_css_var(name)
+            added.add(name)
+    return frozenset(added)
 
 
 def css_vars(  # noqa: D202
@@ -44,70 +143,123 @@ def css_vars(  # noqa: D202
 
     """
 
-    @wrapt.decorator  # type: ignore
-    def wrapper(  # pylint: disable=unused-argument
-        wrapped: Callable, instance: Any, args: Any, kwargs: Any
-    ) -> Any:
+    def decorator(wrapped: Callable) -> Any:
         """Decorate a function to auto-add undefined vars as CSS vars.
 
-        It works by running the `wrapped` function, catching ``NameError`` and create the variable
-        that caused this exception. This is repeated until there is no more ``NameError``.
-
         Parameters
         ----------
         wrapped : Callable
-            The function to decorate.
-        instance : Any
-            The instance calling the function if `wrapped` is a method.
-        args : Any
-            The named arguments passed to the `wrapped` function.
-        kwargs : Any
-            The unnamed arguments passed to the `wrapped` function.
-
-        Raises
-        ------
-        RecursionError
-            When more than ``max_undefined_vars`` undefined variables where found.
+            The function to decorate. Can also be a ``classmethod`` or a ``staticmethod``.
 
         Returns
         -------
         Any
-            The result of the call to `wrapper`.
+            The decorated function, of the same kind as `wrapped`.
 
         """
-        iterations = 0
-        while iterations < max_undefined_vars:
-            try:
-                with import_css(namespace):
-                    return wrapped(*args, **kwargs)
-            except NameError as exc:
-                name = str(exc).split("'")[1]
-                # print(f"Resolve {name}")
-                add_css_var(name)
-                iterations += 1
-
-        raise RecursionError(
-            f"Too much iteration to decode `{wrapped.__name__}` (last: `{name}`)"
-        )
-
-    return wrapper
-
-
-@contextmanager
-def import_css(  # pylint: disable=missing-yield-doc,missing-yield-type-doc
-    namespace: Dict[str, Any]
-) -> Generator:
+        if isinstance(wrapped, (classmethod, staticmethod)):
+            return type(wrapped)(decorator(wrapped.__func__))
+
+        prepared = False
+        # the names added as CSS vars by looking at the code of `wrapped`
+        prescanned: FrozenSet[str] = frozenset()
+        wrapped_globals = getattr(wrapped, "__globals__", namespace)
+
+        @wraps(wrapped)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Call `wrapped`, adding as CSS vars the undefined variables it uses.
+
+            The globals used by the `wrapped` function that are not defined are first added as
+            CSS vars (only on the first call). As they are found by looking at the code, names
+            used in branches that are not run are also added, but not the ones set by the
+            function itself via ``global``, nor the ones already defined at the time of this
+            first call. If some of these names are defined later, in `namespace`, in the globals
+            of `wrapped` or in the builtins, they are not replaced by the CSS vars during the
+            next calls. Then it works by running the `wrapped` function,
+            catching ``NameError`` (for names not found by looking at the code, for example if
+            used in another function) and create the variable that caused this exception. This
+            is repeated until there is no more ``NameError``.
+
+            Parameters
+            ----------
+            args : Any
+                The unnamed arguments passed to the `wrapped` function.
+            kwargs : Any
+                The named arguments passed to the `wrapped` function.
+
+            Raises
+            ------
+            RecursionError
+                When more than ``max_undefined_vars`` undefined variables where found.
+
+            Returns
+            -------
+            Any
+                The result of the call to `wrapped`.
+
+            """
+            nonlocal prepared, prescanned
+            if not prepared:
+                code = getattr(wrapped, "__code__", None)
+                if code is not None:
+                    # after this, all the undefined vars will be known, so no need to do it again
+                    prescanned = add_undefined_css_vars(
+                        code, namespace, wrapped_globals
+                    )
+                prepared = True
+
+            # names defined since the first call must not be hidden by the CSS vars
+            skipped = frozenset(
+                name
+                for name in prescanned
+                if is_defined(name, namespace, wrapped_globals)
+            )
+
+            iterations = 0
+            while iterations < max_undefined_vars:
+                try:
+                    with import_css(namespace, skipped):
+                        return wrapped(*args, **kwargs)
+                except NameError as exc:
+                    # the `name` attribute only exists since python 3.10
+                    name = getattr(exc, "name", None) or str(exc).split("'")[1]
+                    # print(f"Resolve {name}")
+                    add_css_var(name)
+                    iterations += 1
+
+            raise RecursionError(
+                f"Too much iteration to decode `{wrapped.__name__}` (last: `{name}`)"
+            )
+
+        return wrapper
+
+    return decorator
+
+
+class ImportCss:
     """Import all vars defined in ``CSS_VARS`` into the given `namespace`.
 
     It must be called with ``globals()`` for the `namespace` argument, in order to have all the
     CSS variables imported in the scope of the caller.
 
-    Must be used as a context manager, to have the namespace restored at the end.
+    Must be used as a context manager, to have the namespace restored at the end: the vars that
+    were added are removed, and the entries that were replaced by vars are restored.
 
-    Parameters
+    Other changes made to the namespace inside the block are kept: new names (for example set
+    via ``global`` in a function decorated by ``css_vars``) stay, and deleted names are not
+    restored. Only names that are also CSS vars are removed or restored.
+
+    Attributes
     ----------
     namespace : Dict[str, Any]
         The dict where to add the vars defined in ``CSS_VARS``.
+    skipped : FrozenSet[str]
+        The names of the vars not to add in `namespace`: if they are already in `namespace`,
+        they are left untouched.
+    added : FrozenSet[str]
+        The names of the vars that were not in `namespace` before entering the context manager.
+    replaced : Dict[str, Any]
+        The entries of `namespace` that were replaced by vars when entering the context manager.
 
     Examples
     --------
@@ -126,13 +278,64 @@ def import_css(  # pylint: disable=missing-yield-doc,missing-yield-type-doc
     NameError: name 'margin' is not defined
 
     """
-    namespace_copy = namespace.copy()
-    try:
+
+    def __init__(
+        self, namespace: Dict[str, Any], skipped: FrozenSet[str] = frozenset()
+    ) -> None:
+        """Init the context manager.
+
+        Parameters
+        ----------
+        namespace : Dict[str, Any]
+            The dict where to add the vars defined in ``CSS_VARS``.
+        skipped : FrozenSet[str]
+            The names of the vars not to add in `namespace`. Default to an empty set.
+
+        """
+        self.namespace = namespace
+        self.skipped = skipped
+        self.added: FrozenSet[str] = frozenset()
+        self.replaced: Dict[str, Any] = {}
+
+    def __enter__(self) -> None:
+        """Add the vars in the namespace, saving what is needed to restore it."""
+        namespace, skipped = self.namespace, self.skipped
+        css_vars_keys = get_css_vars_keys()
+        self.added = css_vars_keys.difference(namespace, skipped)
+        self.replaced = {
+            key: namespace[key]
+            for key in css_vars_keys.intersection(namespace)
+            if key not in skipped
+        }
+        if not skipped:
+            namespace.update(CSS_VARS)
+            return
+
+        # faster to add all the vars and then put back the skipped ones than to filter them
+        kept = {key: namespace[key] for key in skipped if key in namespace}
         namespace.update(CSS_VARS)
-        yield
-    finally:
-        namespace.clear()
-        namespace.update(namespace_copy)
+        for key in skipped:
+            if key in kept:
+                namespace[key] = kept[key]
+            else:
+                namespace.pop(key, None)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Restore the namespace as it was before entering the context manager.
+
+        Parameters
+        ----------
+        exc_info : Tuple[Any, ...]
+            The exception information, if any. Not used, exceptions are not suppressed.
+
+        """
+        namespace = self.namespace
+        for key in self.added:
+            namespace.pop(key, None)
+        namespace.update(self.replaced)
+
+
+import_css = ImportCss  # pylint: disable=invalid-name
 
 
 def import_css_global(namespace: Dict[str, Any]) -> None:
@@ -160,7 +363,14 @@ def import_css_global(namespace: Dict[str, Any]) -> None:
     namespace.update(CSS_VARS)
 
 
-def load_css_keywords(keywords: Optional[List[str]] = None) -> None:
+# if the full list of keywords was already loaded by ``load_css_keywords``
+_main_keywords_loaded: bool = False
+# the last list of keywords explicitly passed to ``load_css_keywords``
+_last_keywords: Optional[Tuple[str, ...]] = None
+_load_css_keywords_lock = Lock()
+
+
+def load_css_keywords(keywords: Optional[Iterable[str]] = None) -> None:
     """Load all the given list of CSS keywords and units in ``CSS_VARS``.
 
     If the list of keywords is not set, it will load the one from
@@ -169,31 +379,44 @@ def load_css_keywords(keywords: Optional[List[str]] = None) -> None:
     Default vars and units will be reloaded after the loading of the keyword to be sure
     to always have them available.
 
+    Loading the same list as the last time does nothing.
+
+    It is thread-safe: if called at the same time by many threads, the keywords will be loaded
+    only once.
+
     Parameters
     ----------
-    keywords : List[str]
+    keywords : Iterable[str]
         The list of css keywords to load. Default to ``None``. In this case, will use the
         full list from ``mixt.contrib.css.css_keywords_list``.
 
     """
-    from .units import load_css_units  # pylint: disable=import-outside-toplevel
-
-    if keywords is None:
-        if load_css_keywords.main_is_done:  # type: ignore
-            return
-        load_css_keywords.main_is_done = True  # type: ignore
-        from .css_keywords_list import (  # pylint: disable=import-outside-toplevel
-            KEYWORDS,
-        )
-
-        keywords = KEYWORDS
-
-    for name in keywords:
-        add_css_var(name)
-
-    # we always reload our defaults and units
-    load_defaults()
-    load_css_units()
+    # pylint: disable=global-statement
+    global _main_keywords_loaded, _last_keywords
 
+    from .units import load_css_units  # pylint: disable=import-outside-toplevel
 
-load_css_keywords.main_is_done = False  # type: ignore
+    # avoid loading the same keywords many times when called from concurrent threads
+    with _load_css_keywords_lock:
+        if keywords is None:
+            if _main_keywords_loaded:
+                return
+            _main_keywords_loaded = True
+            from .css_keywords_list import (  # pylint: disable=import-outside-toplevel
+                KEYWORDS,
+            )
+
+            names: Sequence[str] = KEYWORDS
+
+        else:
+            # `keywords` may be any iterable, even one that can be consumed only once
+            keywords_tuple = tuple(keywords)
+            if keywords_tuple == _last_keywords:
+                return
+            _last_keywords = names = keywords_tuple
+
+        add_css_vars(names)
+
+        # we always reload our defaults and units
+        load_defaults()
+        load_css_units()
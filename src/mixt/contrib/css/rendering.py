@@ -1,7 +1,8 @@
 """Tools to render a "dict" representing some CSS into a CSS string."""
 
+from collections import deque
 from types import GeneratorType
-from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 from .modes import Modes, get_default_mode
 from .units import QuantifiedUnit
@@ -9,6 +10,36 @@ from .utils import dict_hash
 from .vars import Combine, Comment, Extend, Override, Raw, combine, join, many
 
 
+# defined once here to avoid computing them in the signatures of the functions
+# defined in ``_render_css``, at each (recursive) call
+CssSource = Union[Dict[str, Any], Combine]
+ExtendSource = Union[str, Dict[str, Any], Combine, Extend]
+Selectors = List[str]
+
+
+class RenderingConf(NamedTuple):
+    """Configuration on how to render some CSS, built from the value of a ``Modes`` member."""
+
+    indent: str
+    endline: str
+    sel_after_endline: str
+    decl_endline: str
+    indent_closing_incr: int
+    decl_incr: int
+    space: str
+    opening_endline: str
+    closing_endline: str
+    indent_children: bool
+    force_indent_rule_children: str
+    last_semi: bool
+    display_comments: bool
+
+
+RENDERING_CONFS: Dict[Modes, RenderingConf] = {
+    mode: RenderingConf(**mode.value) for mode in Modes
+}
+
+
 def render_css(css: Union[Dict, Combine], mode: Optional[Modes] = None) -> str:
     """Convert some CSS given as a dict, to a string.
 
@@ -29,7 +60,7 @@ def render_css(css: Union[Dict, Combine], mode: Optional[Modes] = None) -> str:
     if mode is None:
         mode = get_default_mode()
 
-    return _render_css("", css, mode.value)
+    return _render_css("", css, RENDERING_CONFS[mode])
 
 
 _RAW_KEY: str = "::RAW::"
@@ -62,33 +93,11 @@ _NO__SELECTOR_TEMPLATE: str = "".join(
 """.split()
 )
 
-_DECLARATION_TEMPLATE: str = "".join(
-    """
-%(indent)s
-%(KEY)s : %(space)s %(VALUE)s
-%(semicolon)s
-""".split()
-)
-
-_DECLARATION_NO_VALUE_TEMPLATE: str = "".join(
-    """
-%(indent)s
-%(KEY)s
-%(semicolon)s
-""".split()
-)
-_RAW_DECLARATION_TEMPLATE: str = "".join(
-    """
-%(indent)s
-%(VALUE)s
-""".split()
-)
-
 
-def _render_selector(
+def _render_selector(  # pylint: disable=too-many-locals
     selector: str,
     declarations: List[Tuple[str, Union[str, None]]],
-    conf: Dict,
+    conf: RenderingConf,
     level: int,
     force_indent: str,
 ) -> str:
@@ -102,7 +111,7 @@ def _render_selector(
         The list of declarations to render for this selector.
         Each declaration is a tuple with key and value.
         The value can be ``None``. In this case, only the part before the ``:`` is rendered.
-    conf : Dict
+    conf : RenderingConf
         Configuration on how to render the selector.
     level : int
         In indent mode, the indentation level to use.
@@ -123,62 +132,55 @@ def _render_selector(
 
     last_decl_index: int = len(declarations) - 1
 
-    if not selector or (selector == _RAW_KEY and not conf["indent_children"]):
+    if not selector or (selector == _RAW_KEY and not conf.indent_children):
         level = level - 1
 
-    css_declarations: str = conf["decl_endline"].join(
-        (
-            _DECLARATION_NO_VALUE_TEMPLATE
-            if value is None
-            else _RAW_DECLARATION_TEMPLATE
-            if key == _RAW_KEY
-            else _DECLARATION_TEMPLATE
-        )
-        % {
-            "KEY": key,
-            "VALUE": value,
-            "indent": (
-                (force_indent if index else "")
-                + conf["indent"] * (level + conf["decl_incr"])
-            )
-            if "\n" in conf["decl_endline"] or not index
-            else "",
-            "space": conf["space"],
-            "semicolon": ";" if index != last_decl_index or conf["last_semi"] else "",
-        }
-        for index, (key, value) in enumerate(declarations)
-    )
+    decl_endline: str = conf.decl_endline
+    space: str = conf.space
+    first_indent: str = conf.indent * (level + conf.decl_incr)
+    # if declarations are not on their own lines, only the first one is indented
+    other_indent: str = force_indent + first_indent if "\n" in decl_endline else ""
+    last_semicolon: str = ";" if conf.last_semi else ""
+
+    css_declarations_parts: List[str] = []
+    for index, (key, value) in enumerate(declarations):
+        indent = other_indent if index else first_indent
+        semicolon = ";" if index != last_decl_index else last_semicolon
+        if value is None:
+            css_declarations_parts.append(f"{indent}{key}{semicolon}")
+        elif key == _RAW_KEY:
+            css_declarations_parts.append(f"{indent}{value}")
+        else:
+            css_declarations_parts.append(f"{indent}{key}:{space}{value}{semicolon}")
+
+    css_declarations: str = decl_endline.join(css_declarations_parts)
 
-    if (
-        declarations
-        and declarations[-1][0] == _RAW_KEY
-        and conf["closing_endline"] == " "
-    ):
-        conf = dict(conf, closing_endline="\n")
+    if declarations and declarations[-1][0] == _RAW_KEY and conf.closing_endline == " ":
+        conf = conf._replace(closing_endline="\n")
 
     if selector == _RAW_KEY:
         stack_result = _RAW_TEMPLATE % {
             "DECLARATIONS": css_declarations,
-            "sel_after_endline": conf["sel_after_endline"],
+            "sel_after_endline": conf.sel_after_endline,
         }
     elif selector:
         stack_result = _SELECTOR_TEMPLATE % {
             "SELECTOR": selector,
             "DECLARATIONS": css_declarations,
-            "indent": force_indent + conf["indent"] * level,
-            "indent_end": (conf["indent"] * (level + conf["indent_closing_incr"]))
-            if "\n" in conf["closing_endline"]
+            "indent": force_indent + conf.indent * level,
+            "indent_end": (conf.indent * (level + conf.indent_closing_incr))
+            if "\n" in conf.closing_endline
             else "",
-            "endline": conf["endline"],
-            "space": conf["space"],
-            "sel_after_endline": conf["sel_after_endline"],
-            "opening_endline": conf["opening_endline"],
-            "closing_endline": conf["closing_endline"],
+            "endline": conf.endline,
+            "space": conf.space,
+            "sel_after_endline": conf.sel_after_endline,
+            "opening_endline": conf.opening_endline,
+            "closing_endline": conf.closing_endline,
         }
     else:
         stack_result = _NO__SELECTOR_TEMPLATE % {
             "DECLARATIONS": css_declarations,
-            "closing_endline": conf["closing_endline"],
+            "closing_endline": conf.closing_endline,
         }
 
     declarations.clear()
@@ -267,7 +269,7 @@ class RenderingExtend(NamedTuple):
 def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-locals
     selector: str,
     css: Union[Dict, Combine],
-    conf: Dict,
+    conf: RenderingConf,
     level: int = -1,
     force_indent: str = "",
     no_indent_min_level: int = 0,
@@ -281,7 +283,7 @@ def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-local
         The base selector. Will be present before the opening ``{``.
     css : Dict
         The CSS, as a dict or an instance of ``Combine``, to render.
-    conf : Dict
+    conf : RenderingConf
         Configuration on how to render the css.
     level : int
         In indent mode, the indentation level to use.
@@ -307,25 +309,21 @@ def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-local
     """
     declarations: List[Tuple[str, Union[str, None]]] = []
     comments: List[Tuple[str, Union[str, None]]] = []
-    result: str = ""
+    result_parts: List[str] = []
 
     selector = selector.strip()
 
-    next_level: int = level + 1 if conf["indent_children"] else no_indent_min_level
+    next_level: int = level + 1 if conf.indent_children else no_indent_min_level
 
     _extends: Dict[str, RenderingExtend] = extends or {}
 
     new_extends: List[str] = []
 
-    render_selector_level: int = level if conf[
-        "indent_children"
-    ] else no_indent_min_level
+    render_selector_level: int = level if conf.indent_children else no_indent_min_level
 
-    stack: List[Tuple[str, Union[Dict, str]]] = list(css.items())
+    stack: Deque[Tuple[str, Union[Dict, str]]] = deque(css.items())
 
-    def register_extend(
-        dct: Union[Dict[str, Any], Combine], name: Optional[str] = None
-    ) -> str:
+    def register_extend(dct: CssSource, name: Optional[str] = None) -> str:
         """Register a new extend.
 
         A registered extend can then by used by the hash of the dict (obtained by calling
@@ -361,8 +359,7 @@ def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-local
             _extends[dct_hash] = RenderingExtend("", dct, [])
 
             # put string in result that will be replaced at the end
-            nonlocal result
-            result += f"<extend:{dct_hash}>"  # pylint: disable=undefined-variable
+            result_parts.append(f"<extend:{dct_hash}>")
             new_extends.append(dct_hash)
 
         if name:
@@ -372,9 +369,7 @@ def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-local
 
         return dct_hash
 
-    def use_extend(
-        selector: str, extend: Union[str, Dict[str, Any], Combine, Extend]
-    ) -> None:
+    def use_extend(selector: str, extend: ExtendSource) -> None:
         """Use the `extend` for the given `selector`.
 
         Parameters
@@ -419,25 +414,32 @@ def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-local
             as the declarations. If ``False``, the default, they will be rendered after.
 
         """
-        nonlocal result
         if declarations:
             if merge_comments:
                 if comments:
                     declarations.extend(comments)
                 comments.clear()
-            result += _render_selector(
-                selector, declarations, conf, render_selector_level, force_indent
+            result_parts.append(
+                _render_selector(
+                    selector, declarations, conf, render_selector_level, force_indent
+                )
             )
         if comments:
-            result += _render_selector(
-                _RAW_KEY, comments, dict(conf, decl_incr=1), render_selector_level, ""
+            result_parts.append(
+                _render_selector(
+                    _RAW_KEY,
+                    comments,
+                    conf._replace(decl_incr=1),
+                    render_selector_level,
+                    "",
+                )
             )
 
     while stack:  # pylint: disable=too-many-nested-blocks
         key: Union[str, Sequence[str]]
         value: Any
 
-        key, value = stack.pop(0)
+        key, value = stack.popleft()
 
         if isinstance(value, (dict, Combine)):
             render_current_stack(merge_comments=False)
@@ -467,22 +469,25 @@ def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-local
                     value,
                     conf,
                     next_level,
-                    force_indent=force_indent + conf["force_indent_rule_children"],
+                    force_indent=force_indent + conf.force_indent_rule_children,
                     no_indent_min_level=no_indent_min_level + 1,
-                ).rstrip(conf["endline"])
-
-                result += _SELECTOR_TEMPLATE % {
-                    "SELECTOR": key,
-                    "DECLARATIONS": at_rule_declarations,
-                    "indent": conf["indent"] * next_level,
-                    "indent_end": conf["indent"]
-                    * (next_level + conf["indent_closing_incr"]),
-                    "endline": conf["endline"],
-                    "space": conf["space"],
-                    "sel_after_endline": conf["sel_after_endline"],
-                    "opening_endline": conf["sel_after_endline"],  # on purpose
-                    "closing_endline": conf["closing_endline"],
-                }
+                ).rstrip(conf.endline)
+
+                result_parts.append(
+                    _SELECTOR_TEMPLATE
+                    % {
+                        "SELECTOR": key,
+                        "DECLARATIONS": at_rule_declarations,
+                        "indent": conf.indent * next_level,
+                        "indent_end": conf.indent
+                        * (next_level + conf.indent_closing_incr),
+                        "endline": conf.endline,
+                        "space": conf.space,
+                        "sel_after_endline": conf.sel_after_endline,
+                        "opening_endline": conf.sel_after_endline,  # on purpose
+                        "closing_endline": conf.closing_endline,
+                    }
+                )
 
             elif not isinstance(key, str) and [k for k in key if k.startswith("@")]:
                 raise ValueError(
@@ -499,18 +504,18 @@ def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-local
                 if _contains_properties(value):
                     sub_level = next_level
                 else:
-                    sub_level = (
-                        level if conf["indent_children"] else no_indent_min_level
-                    )
+                    sub_level = level if conf.indent_children else no_indent_min_level
 
-                result += _render_css(
-                    _compose_selector(selector, key),
-                    value,
-                    conf,
-                    sub_level,
-                    force_indent,
-                    no_indent_min_level,
-                    _extends,
+                result_parts.append(
+                    _render_css(
+                        _compose_selector(selector, key),
+                        value,
+                        conf,
+                        sub_level,
+                        force_indent,
+                        no_indent_min_level,
+                        _extends,
+                    )
                 )
 
         elif isinstance(value, Extend):
@@ -519,7 +524,7 @@ def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-local
             for extend in value.extends:
                 use_extend(child_selector, extend)
 
-            stack.insert(0, (key, value.css or {}))
+            stack.appendleft((key, value.css or {}))
 
         else:
             if not isinstance(key, str):
@@ -531,7 +536,7 @@ def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-local
                 raise ValueError(f"A CSS property cannot start with %: {key}")
 
             if key.startswith(Comment.prefix):
-                if conf["display_comments"]:
+                if conf.display_comments:
                     lines = value.split("\n")
                     for index, line in enumerate(lines):
                         declaration = line.strip()
@@ -556,18 +561,19 @@ def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-local
                     declarations.extend(
                         (_RAW_KEY, line.strip()) for line in content.split("\n")
                     )
-                result += _render_selector(
-                    _RAW_KEY,
-                    declarations,
-                    dict(
-                        conf,
-                        decl_incr=1,
-                        # closing_endline="\n"
-                        # if conf["closing_endline"] == " "
-                        # else conf["closing_endline"],
-                    ),
-                    render_selector_level,
-                    "",
+                result_parts.append(
+                    _render_selector(
+                        _RAW_KEY,
+                        declarations,
+                        conf._replace(
+                            decl_incr=1,
+                            # closing_endline="\n"
+                            # if conf.closing_endline == " "
+                            # else conf.closing_endline,
+                        ),
+                        render_selector_level,
+                        "",
+                    )
                 )
                 continue
 
@@ -589,7 +595,7 @@ def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-local
 
     render_current_stack(merge_comments=True)
 
-    def get_ext_selectors(ext_selectors: List[str]) -> List[str]:
+    def get_ext_selectors(ext_selectors: Selectors) -> Selectors:
         """Get the final list of selectors for an extend.
 
         All selectors in `ext_selectors` will be added, and the ones starting with a ``%``
@@ -615,6 +621,8 @@ def _render_css(  # noqa: 37  # pylint: disable=too-many-branches,too-many-local
             result_selectors += get_ext_selectors(_extends[ext_selector].selectors)
         return result_selectors
 
+    result: str = "".join(result_parts)
+
     for extend_key in new_extends:
         # extract by the dict hash
         new_extend = _extends.pop(extend_key)
@@ -878,6 +878,8 @@ class Unit(Var):
 
     """
 
+    __slots__ = ()
+
     def __call__(  # type: ignore  # pylint: disable=arguments-differ
         self, value: Number
     ) -> QuantifiedUnit:
@@ -11,6 +11,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Optional,
@@ -38,6 +39,9 @@ class Var(str):
 
     """
 
+    # there are thousands of instances in ``CSS_VARS``, so we don't want a ``__dict__`` for each
+    __slots__ = ()
+
     @classmethod
     def many(cls: Type["Var"], *names: str) -> List["Var"]:
         """Create many ``Var`` at once.
@@ -1250,6 +1254,8 @@ class CssVarsDict(dict):
     __values__ : CssValuesType
         Will hold "unique" values. Used to create new vars that have different keys but the same
         values.
+    __keys__ : Optional[FrozenSet[str]]
+        Cache of the keys, used by ``get_css_vars_keys``. Reset each time the dict is modified.
 
     Examples
     --------
@@ -1274,9 +1280,88 @@ class CssVarsDict(dict):
             The key/value pairs to store in the dict at create time.
 
         """
+        self.__keys__: Optional[FrozenSet[str]] = None
         super().__init__(**kwargs)
         self.__values__: CssValuesType = {}
 
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set the value for `key` and reset the keys cache.
+
+        Parameters
+        ----------
+        key : str
+            The key to set.
+        value : Any
+            The value to set for `key`.
+
+        """
+        self.__keys__ = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        """Delete the `key` and reset the keys cache.
+
+        Parameters
+        ----------
+        key : str
+            The key to delete.
+
+        """
+        self.__keys__ = None
+        super().__delitem__(key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore
+        """Update the dict and reset the keys cache.
+
+        For the parameters, see ``dict.update``.
+
+        """
+        self.__keys__ = None
+        super().update(*args, **kwargs)
+
+    def __ior__(self, other: Any) -> "CssVarsDict":  # type: ignore
+        """Update the dict with ``|=`` and reset the keys cache.
+
+        Done via ``update``, as ``dict.__ior__`` only exists since python 3.9.
+
+        For the parameters and return value, see ``dict.__ior__``.
+
+        """
+        self.update(other)
+        return self
+
+    def pop(self, *args: Any) -> Any:  # type: ignore
+        """Remove a key from the dict, and reset the keys cache.
+
+        For the parameters and return value, see ``dict.pop``.
+
+        """
+        self.__keys__ = None
+        return super().pop(*args)
+
+    def popitem(self) -> Tuple[str, Any]:
+        """Remove an item from the dict, and reset the keys cache.
+
+        For the return value, see ``dict.popitem``.
+
+        """
+        self.__keys__ = None
+        return super().popitem()
+
+    def clear(self) -> None:
+        """Empty the dict and reset the keys cache."""
+        self.__keys__ = None
+        super().clear()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Set the `key` to `default` if not in the dict, and reset the keys cache.
+
+        For the parameters and return value, see ``dict.setdefault``.
+
+        """
+        self.__keys__ = None
+        return super().setdefault(key, default)
+
     def __getattr__(self, name: str) -> Any:
         """Return the value stored for the key `name`.
 
@@ -1411,6 +1496,9 @@ def add_css_var(  # pylint: disable=too-many-branches
         else:
             names_by_value[get_value(name)].extend([name, name.capitalize()])
 
+    # all the new vars are saved at once at the end, to have only one resize of ``css_vars``
+    new_vars: Dict[str, Any] = {}
+
     for value, names in names_by_value.items():
 
         final_names = []
@@ -1427,16 +1515,71 @@ def add_css_var(  # pylint: disable=too-many-branches
         if css_values_key not in css_vars.__values__:
             css_vars.__values__[css_values_key] = value
 
+        css_value = css_vars.__values__[css_values_key]
         for name in final_names:
-            # print(f"Registering `{name}`: `{value}`")
-            css_vars[name] = css_vars.__values__[css_values_key]
+            # print(f"Registering `{name}`: `{css_value}`")
+            new_vars[name] = css_value
+
+    css_vars.update(new_vars)
+
+
+def add_css_vars(names: Sequence[str], css_vars: Optional[CssVarsDict] = None) -> None:
+    """Add many css variables at once.
+
+    It's the same as calling ``add_css_var`` for each name, but faster as they are all
+    handled in one call.
+
+    Parameters
+    ----------
+    names : Sequence[str]
+        The base names of the vars to be created. See ``add_css_var`` for more information.
+
+    css_vars : Optional[CssVarsDict]
+        The dict in which to store the new var(s). If not set, the global ``CSS_VARS``
+        will be used.
+
+    """
+    if names:
+        add_css_var(names[0], aliases=list(names[1:]), css_vars=css_vars)
+
+
+def get_css_vars_keys(css_vars: Optional[CssVarsDict] = None) -> FrozenSet[str]:
+    """Get the keys of `css_vars`, as a ``frozenset`` that is only computed when keys change.
+
+    Parameters
+    ----------
+    css_vars : Optional[CssVarsDict]
+        The dict for which we want the keys. If not set, the global ``CSS_VARS`` will be used.
+
+    Returns
+    -------
+    FrozenSet[str]
+        The keys of `css_vars`.
+
+    """
+    if css_vars is None:
+        css_vars = CSS_VARS
+
+    # the cache is reset each time the dict is modified
+    if css_vars.__keys__ is None:
+        css_vars.__keys__ = frozenset(css_vars)
+
+    return css_vars.__keys__
 
 
 CSS_VARS: CssVarsDict = CssVarsDict()
 
 # pylint: disable=invalid-name,attribute-defined-outside-init
 
-dummy = Var("")
+
+class Dummy(Var):
+    """Subclass of ``Var`` only used for ``dummy``.
+
+    It has no ``__slots__``, to be able to set ``__doc__`` on the instance.
+    """
+
+
+dummy = Dummy("")
 dummy.__doc__ = """Special "empty" var.
 
 To use to force things to behave like a ``Var``.
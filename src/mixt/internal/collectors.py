@@ -469,6 +469,7 @@ class Collector(Element, metaclass=CollectorMetaclass):
         """
         self.__collected__: Dict[str, List[AnElement]] = defaultdict(list)
         self.__classes_no_methods__: Dict[Type, Set[str]] = defaultdict(set)
+        self.__classes_global_done__: Set[Type] = set()
         self.__global_methods_done_for_namespaces__: Dict[  # pylint: disable=invalid-name
             str, Set[Callable]
         ] = defaultdict(
@@ -521,8 +522,14 @@ class Collector(Element, metaclass=CollectorMetaclass):
             no_methods = self.__classes_no_methods__[child.__class__]
 
             method_name = f"render_{self.KIND}_global"
-            if method_name not in no_methods:
+            classes_global_done = self.__classes_global_done__
+            if (
+                method_name not in no_methods
+                and child.__class__ not in classes_global_done
+            ):
                 for base in reversed(child.__class__.__mro__):
+                    if base in classes_global_done:
+                        continue
                     no_methods_base = self.__classes_no_methods__[base]
                     if method_name in no_methods_base:
                         continue
@@ -538,6 +545,7 @@ class Collector(Element, metaclass=CollectorMetaclass):
                         raise MixtException(
                             f"{name}.{method_name} must be a classmethod"
                         )
+                    classes_global_done.add(base)
                     self.append_collected(
                         self.call_collected_method(method, context, True),
                         is_global=True,
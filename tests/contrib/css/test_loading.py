@@ -1,8 +1,10 @@
 from contextlib import contextmanager
+from threading import Thread
+from time import sleep
 
 import pytest
 
-from mixt.contrib.css import render_css
+from mixt.contrib.css import loading, render_css
 from mixt.contrib.css.loading import CSS_VARS, css_vars, import_css, load_css_keywords
 
 from .test_vars import test_defaults
@@ -23,7 +25,7 @@ def tmp_load_keywords():
         load_css_keywords()
         yield
     finally:
-        load_css_keywords.main_is_done = False
+        loading._main_keywords_loaded = False
         CSS_VARS.clear()
         CSS_VARS.update(css_vars_copy)
 
@@ -39,6 +41,95 @@ def test_load_css_keywords():
     assert len_css_vars() == DEFAULT_CSS_VARS_LEN
 
 
+def test_load_css_keywords_only_once():
+    with tmp_load_keywords():
+        CSS_VARS["none"] = "custom"
+        load_css_keywords()
+        # not loaded again, so the value set by hand is kept
+        assert CSS_VARS["none"] == "custom"
+
+
+def test_load_css_keywords_from_many_threads(monkeypatch):
+    loaded = []
+    add_css_vars = loading.add_css_vars
+
+    def add_and_count_css_vars(names):
+        loaded.append(names)
+        sleep(0.05)  # let the other threads try to load the keywords meanwhile
+        add_css_vars(names)
+
+    monkeypatch.setattr(loading, "add_css_vars", add_and_count_css_vars)
+
+    lengths_after_loading = []
+
+    def load():
+        load_css_keywords()
+        lengths_after_loading.append(len_css_vars())
+
+    css_vars_copy = CSS_VARS.copy()
+    try:
+        threads = [Thread(target=load) for __ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # loaded only once, and all the threads waited for the end of the loading
+        assert len(loaded) == 1
+        assert len(lengths_after_loading) == 4
+        assert len(set(lengths_after_loading)) == 1
+    finally:
+        loading._main_keywords_loaded = False
+        CSS_VARS.clear()
+        CSS_VARS.update(css_vars_copy)
+
+
+def test_load_same_css_keywords_only_once(monkeypatch):
+    loaded = []
+    add_css_vars = loading.add_css_vars
+
+    def add_and_count_css_vars(names):
+        loaded.append(names)
+        add_css_vars(names)
+
+    monkeypatch.setattr(loading, "add_css_vars", add_and_count_css_vars)
+
+    css_vars_copy = CSS_VARS.copy()
+    try:
+        load_css_keywords(["foo-bar", "baz"])
+        assert len_css_vars() == DEFAULT_CSS_VARS_LEN + 9
+        assert len(loaded) == 1
+
+        load_css_keywords(["foo-bar", "baz"])
+        # same list as the last time: nothing was loaded
+        assert len(loaded) == 1
+
+        load_css_keywords(["baz"])
+        assert len(loaded) == 2
+
+        # values set by hand are not overridden by loading the same list again
+        CSS_VARS["baz"] = "custom"
+        load_css_keywords(["baz"])
+        assert len(loaded) == 2
+        assert CSS_VARS["baz"] == "custom"
+    finally:
+        loading._last_keywords = None
+        CSS_VARS.clear()
+        CSS_VARS.update(css_vars_copy)
+
+
+def test_load_css_keywords_from_iterator():
+    css_vars_copy = CSS_VARS.copy()
+    try:
+        load_css_keywords(iter(["foo-bar", "baz"]))
+        assert len_css_vars() == DEFAULT_CSS_VARS_LEN + 9
+        assert CSS_VARS["foo_bar"] == "foo-bar"
+        assert "baz" in CSS_VARS
+    finally:
+        loading._last_keywords = None
+        CSS_VARS.clear()
+        CSS_VARS.update(css_vars_copy)
+
+
 def test_default_still_works_after_loading():
     with tmp_load_keywords():
         test_defaults()
@@ -59,7 +150,75 @@ def test_import_css():
         3 * px
 
 
+def test_import_css_restores_replaced_entries():
+    namespace = {"px": "not a var", "foo": "bar"}
+
+    with import_css(namespace):
+        assert namespace["px"] is CSS_VARS["px"]
+        assert namespace["foo"] == "bar"
+        assert len(namespace) == len(CSS_VARS) + 1
+
+    assert namespace == {"px": "not a var", "foo": "bar"}
+
+
 # noinspection PyUnresolvedReferences
+def test_import_css_keeps_other_changes():
+    namespace = {"foo": 1, "bar": 2}
+    with import_css(namespace):
+        namespace["baz"] = 3
+        del namespace["bar"]
+
+    # only the CSS vars are removed: names added or deleted in the block are not restored
+    assert namespace == {"foo": 1, "baz": 3}
+
+
+def test_import_css_with_skipped_names():
+    namespace = {"px": "mine"}
+    with import_css(namespace, frozenset({"px", "em"})):
+        assert namespace["px"] == "mine"
+        assert "em" not in namespace
+        assert namespace["rem"] is CSS_VARS["rem"]
+
+    assert namespace == {"px": "mine"}
+
+
+def test_import_css_after_keys_swapped_by_hand():
+    CSS_VARS["tmpa"] = "a"
+    with import_css({}):  # fill the keys cache
+        pass
+    try:
+        del CSS_VARS["tmpa"]
+        CSS_VARS["tmpb"] = "b"
+
+        namespace = {"tmpb": "mine"}
+        with import_css(namespace):
+            assert namespace["tmpb"] == "b"
+        assert namespace == {"tmpb": "mine"}
+
+        namespace = {}
+        with import_css(namespace):
+            assert namespace["tmpb"] == "b"
+        assert namespace == {}
+    finally:
+        CSS_VARS.pop("tmpa", None)
+        CSS_VARS.pop("tmpb", None)
+
+
+def test_import_css_after_keys_added_with_ior():
+    with import_css({}):  # fill the keys cache
+        pass
+    try:
+        css_vars_dict = CSS_VARS
+        css_vars_dict |= {"tmpc": "c"}
+
+        namespace = {"tmpc": "mine"}
+        with import_css(namespace):
+            assert namespace["tmpc"] == "c"
+        assert namespace == {"tmpc": "mine"}
+    finally:
+        CSS_VARS.pop("tmpc", None)
+
+
 def test_css_vars_decorator():
     with tmp_load_keywords():
         # globals are clean
@@ -86,3 +245,124 @@ body {
         # globals are cleared
         with pytest.raises(NameError):
             margin-bottom
+
+
+# noinspection PyUnresolvedReferences
+def test_css_vars_decorator_undefined_vars_resolved_before_call():
+    calls = []
+
+    @css_vars(globals())
+    def css():
+        calls.append(1)
+        return {qux: {corge: [grault for __ in range(1)][0], garply: (lambda: waldo)()}}
+
+    try:
+        assert render_css(css()) == """\
+qux {
+  corge: grault;
+  garply: waldo;
+}
+"""
+        # all undefined vars were found before calling the function, so it was called only once
+        assert len(calls) == 1
+    finally:
+        for name in ("qux", "corge", "grault", "garply", "waldo"):
+            CSS_VARS.pop(name, None)
+            CSS_VARS.pop(name.capitalize(), None)
+
+
+def test_css_vars_decorator_on_classmethod():
+    class Foo:
+        @css_vars(globals())
+        @classmethod
+        def css(cls):
+            return {plugh: {color: cls.__name__}}
+
+    try:
+        assert Foo.css.__name__ == "css"
+        assert render_css(Foo.css()) == """\
+plugh {
+  color: Foo;
+}
+"""
+    finally:
+        # ``color`` is not a default var, so it was added too
+        for name in ("plugh", "color"):
+            CSS_VARS.pop(name, None)
+            CSS_VARS.pop(name.capitalize(), None)
+
+
+# noinspection PyUnresolvedReferences
+def test_css_vars_decorator_keeps_names_set_via_global():
+    @css_vars(globals())
+    def css():
+        global css_vars_test_value
+        css_vars_test_value = "red"
+        return {thud: {fred: css_vars_test_value}}
+
+    try:
+        assert render_css(css()) == """\
+thud {
+  fred: red;
+}
+"""
+        # set by the function, so not a CSS var, and not removed from the namespace
+        assert "css_vars_test_value" not in CSS_VARS
+        assert globals()["css_vars_test_value"] == "red"
+    finally:
+        globals().pop("css_vars_test_value", None)
+        for name in ("thud", "fred"):
+            CSS_VARS.pop(name, None)
+            CSS_VARS.pop(name.capitalize(), None)
+
+
+# noinspection PyUnresolvedReferences
+def test_css_vars_decorator_names_defined_after_decoration():
+    @css_vars(globals())
+    def css():
+        return {xyzzy: {fred: css_vars_test_later}}
+
+    # defined after the decoration but before the call: not a CSS var
+    globals()["css_vars_test_later"] = "blue"
+    try:
+        assert render_css(css()) == """\
+xyzzy {
+  fred: blue;
+}
+"""
+        assert "css_vars_test_later" not in CSS_VARS
+    finally:
+        globals().pop("css_vars_test_later", None)
+        for name in ("xyzzy", "fred"):
+            CSS_VARS.pop(name, None)
+            CSS_VARS.pop(name.capitalize(), None)
+
+
+# noinspection PyUnresolvedReferences
+def test_css_vars_decorator_global_defined_after_first_call():
+    @css_vars(globals())
+    def css(use_it):
+        return {xyzzy: {fred: plughvalue if use_it else "none"}}
+
+    try:
+        # ``plughvalue`` is not defined yet, so it is added as a CSS var
+        assert render_css(css(False)) == """\
+xyzzy {
+  fred: none;
+}
+"""
+        assert "plughvalue" in CSS_VARS
+
+        # defined after the first call: the global is used, not the CSS var
+        globals()["plughvalue"] = "green"
+        assert render_css(css(True)) == """\
+xyzzy {
+  fred: green;
+}
+"""
+        assert globals()["plughvalue"] == "green"
+    finally:
+        globals().pop("plughvalue", None)
+        for name in ("xyzzy", "fred", "plughvalue"):
+            CSS_VARS.pop(name, None)
+            CSS_VARS.pop(name.capitalize(), None)
@@ -6,6 +6,8 @@ from mixt.contrib.css.vars import (
     Var,
     _tovar,
     add_css_var,
+    add_css_vars,
+    get_css_vars_keys,
 )
 
 
@@ -357,6 +359,50 @@ def test_add_css_var():
     assert v3["Nioj2"] is join2
 
 
+def test_add_css_vars():
+    v1 = CssVarsDict()
+    for name in ["foo-bar", "baz", "min"]:
+        add_css_var(name, css_vars=v1)
+
+    v2 = CssVarsDict()
+    add_css_vars(["foo-bar", "baz", "min"], css_vars=v2)
+
+    assert v2 == v1
+    assert v2["min"] is v2["_min"]
+
+    v3 = CssVarsDict()
+    add_css_vars([], css_vars=v3)
+    assert v3 == {}
+
+
+def test_get_css_vars_keys():
+    v = CssVarsDict()
+    add_css_var("foo", css_vars=v)
+    keys = get_css_vars_keys(v)
+    assert keys == {"foo", "Foo"}
+    assert get_css_vars_keys(v) is keys  # cached
+
+    add_css_var("bar", css_vars=v)
+    assert get_css_vars_keys(v) == {"foo", "Foo", "bar", "Bar"}
+
+    del v["bar"]
+    assert get_css_vars_keys(v) == {"foo", "Foo", "Bar"}
+
+    # same length but different keys
+    del v["Bar"]
+    v["baz"] = "baz"
+    assert get_css_vars_keys(v) == {"foo", "Foo", "baz"}
+
+    v.pop("baz")
+    assert get_css_vars_keys(v) == {"foo", "Foo"}
+    v.setdefault("qux", "qux")
+    assert get_css_vars_keys(v) == {"foo", "Foo", "qux"}
+    v.update(quux="quux")
+    assert get_css_vars_keys(v) == {"foo", "Foo", "qux", "quux"}
+    v.clear()
+    assert get_css_vars_keys(v) == frozenset()
+
+
 def test_get_from_css_vars():
     v = CssVarsDict()
     add_css_var("foo-bar", aliases=["baz"], css_vars=v)
@@ -299,6 +299,44 @@ C1Local2Default
 """
 
 
+def test_global_method_called_once_per_collector():
+
+    calls = []
+
+    class Base(Element):
+        @classmethod
+        def render_css_global(cls, context):
+            calls.append(("Base", cls.__name__))
+            return "Base."
+
+    class Component(Base):
+        @classmethod
+        def render_css_global(cls, context):
+            calls.append(("Component", cls.__name__))
+            return "Component."
+
+    class Other(Base):
+        pass
+
+    ref = Ref()
+    str(<CSSCollector ref={ref}>
+        <Component />
+        <Component />
+        <Other />
+        <Component />
+        <Other />
+    </CSSCollector>)
+
+    assert calls == [
+        ("Base", "Base"),
+        ("Component", "Component"),
+        ("Base", "Other"),
+    ]
+
+    with override_default_mode(Modes.COMPRESSED):
+        assert ref.current.render_collected(with_tag=False) == "Base.Component."
+
+
 def test_reuse():
 
     class Component1(Element):